@@ -9,14 +9,225 @@ Learning Notes:
 """
 
 import requests
+import asyncio
+import gzip
 import json
+import os
+import re
 import logging
-from typing import List, Dict, Any, Optional
+import time
+from functools import lru_cache
+import numpy as np
+from typing import List, Dict, Any, Iterable, Optional
 from pathlib import Path
 import tempfile
-from urllib.parse import urljoin
 from utils.config import Config
 
+# Fast JSON for the on-disk caches, with the standard library as fallback
+try:
+    import orjson
+    
+    def _dumps(obj: Any, pretty: bool = False) -> bytes:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any, pretty: bool = False) -> bytes:
+        if pretty:
+            return json.dumps(obj, indent=2).encode('utf-8')
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+    
+    _loads = json.loads
+
+# Optional incremental parser for the large catalog response
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Optional async HTTP client for concurrent preview prefetching
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Numeric category codes for vectorized pairing scores
+_CATEGORY_CODES = {
+    'serif': 0,
+    'sans-serif': 1,
+    'monospace': 2,
+    'display': 3,
+    'handwriting': 4
+}
+
+# Categories suitable for UI elements, headings and body text
+_UI_CATS = frozenset(('sans-serif', 'display'))
+_HEAD_CATS = frozenset(('serif', 'sans-serif', 'display'))
+_BODY_CATS = frozenset(('serif', 'sans-serif'))
+
+# Commonly available system fonts
+_SYSTEM_FONTS = (
+    {
+        'family': 'Arial',
+        'category': 'sans-serif',
+        'system': True,
+        'platforms': ('Windows', 'macOS', 'Linux'),
+        'suitable_for_coding': False
+    },
+    {
+        'family': 'Times New Roman',
+        'category': 'serif',
+        'system': True,
+        'platforms': ('Windows', 'macOS'),
+        'suitable_for_coding': False
+    },
+    {
+        'family': 'Courier New',
+        'category': 'monospace',
+        'system': True,
+        'platforms': ('Windows', 'macOS', 'Linux'),
+        'suitable_for_coding': True
+    },
+    {
+        'family': 'Helvetica',
+        'category': 'sans-serif',
+        'system': True,
+        'platforms': ('macOS', 'Linux'),
+        'suitable_for_coding': False
+    },
+    {
+        'family': 'Monaco',
+        'category': 'monospace',
+        'system': True,
+        'platforms': ('macOS',),
+        'suitable_for_coding': True
+    },
+    {
+        'family': 'Consolas',
+        'category': 'monospace',
+        'system': True,
+        'platforms': ('Windows',),
+        'suitable_for_coding': True
+    },
+    {
+        'family': 'DejaVu Sans Mono',
+        'category': 'monospace',
+        'system': True,
+        'platforms': ('Linux',),
+        'suitable_for_coding': True
+    }
+)
+
+# Pairing rules based on typography principles
+_PAIRING_RULES = {
+    'serif': ('sans-serif', 'display'),
+    'sans-serif': ('serif', 'monospace'),
+    'monospace': ('sans-serif', 'serif'),
+    'display': ('serif', 'sans-serif'),
+    'handwriting': ('serif', 'sans-serif')
+}
+
+# Sample text shown in previews, by font category
+_PREVIEW_TEXTS = {
+    'serif': "The quick brown fox jumps over the lazy dog. Elegant serifs guide the eye along long passages.",
+    'sans-serif': "The quick brown fox jumps over the lazy dog. Clean shapes for interfaces and body text.",
+    'monospace': "def hello_world():\n    print('Hello, World!')  # 0O 1lI {}[]()",
+    'display': "Big Headlines Deserve Bold Type",
+    'handwriting': "A personal note, written by hand."
+}
+
+# Coding-friendly font families
+_CODING_FONTS = (
+    'Fira Code', 'Source Code Pro', 'JetBrains Mono', 'Roboto Mono',
+    'Ubuntu Mono', 'Inconsolata', 'PT Mono', 'Space Mono', 'IBM Plex Mono'
+)
+
+# Default coding features and per-font overrides (lowercase family names)
+_CODING_FONT_FEATURES_BASE = {
+    'ligatures_support': False,
+    'zero_distinction': False,
+    'readability_score': 7,  # Default score out of 10
+    'best_sizes': (10, 11, 12, 13, 14),
+    'recommended_line_height': 1.4
+}
+
+_CODING_FONT_SPECIAL = {
+    'fira code': {
+        'ligatures_support': True,
+        'zero_distinction': True,
+        'readability_score': 9,
+        'best_sizes': (10, 11, 12, 13, 14, 15, 16)
+    },
+    'jetbrains mono': {
+        'ligatures_support': True,
+        'zero_distinction': True,
+        'readability_score': 9,
+        'best_sizes': (10, 11, 12, 13, 14, 15)
+    },
+    'source code pro': {
+        'zero_distinction': True,
+        'readability_score': 8,
+        'best_sizes': (10, 11, 12, 13, 14)
+    },
+    'inconsolata': {
+        'readability_score': 8,
+        'best_sizes': (11, 12, 13, 14, 15)
+    }
+}
+
+# Families cache lifetime in seconds (7 days)
+_FAMILIES_CACHE_TTL = 7 * 24 * 60 * 60
+
+# Lifetime of the built-in fallback list (no API key, or a failed fetch)
+# before the API is tried again
+_FALLBACK_FAMILIES_TTL = 5 * 60
+
+# Harmony score weights (variant richness, subset coverage, popularity, same category)
+_HARMONY_WEIGHTS = (0.45, 0.25, 0.2, 0.1)
+
+@lru_cache(maxsize=512)
+def _google_fonts_css_url(font_family: str) -> str:
+    """Generate Google Fonts CSS URL for a font family."""
+    
+    base_url = "https://fonts.googleapis.com/css2"
+    family_param = font_family.replace(' ', '+')
+    return f"{base_url}?family={family_param}:wght@400;700&display=swap"
+
+@lru_cache(maxsize=256)
+def _build_preview_css(font_family: str, category: str, size: int,
+                       font_face: Optional[str] = None) -> str:
+    """
+    Build the preview CSS for a font family, category and size.
+    
+    Prefetched @font-face rules are inlined in place of the @import.
+    """
+    
+    font_import = font_face or f"@import url('{_google_fonts_css_url(font_family)}');"
+    css_class = font_family.replace(' ', '-').lower()
+    
+    return f"""
+        {font_import}
+        
+        .font-preview-{css_class} {{
+            font-family: '{font_family}', {category};
+            font-size: {size}px;
+            line-height: 1.4;
+            margin: 10px 0;
+            padding: 15px;
+            border: 1px solid #e0e0e0;
+            border-radius: 4px;
+            background: #f9f9f9;
+        }}
+        
+        .font-preview-{css_class}:hover {{
+            background: #f0f0f0;
+            border-color: #c0c0c0;
+        }}
+        """
+
 class FontsAPI:
     """
     Google Fonts API integration for typography enhancement.
@@ -43,16 +254,37 @@ class FontsAPI:
         # Font cache directory
         self.cache_dir = Path.home() / '.codemaster_pro' / 'fonts'
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._families_cache_file = self.cache_dir / 'font_families.json.gz'
+        self._details_cache_file = self.cache_dir / 'font_details_cache.json.gz'
         
         # Local font cache
         self.font_cache = {}
         self.load_cached_fonts()
         
+        # In-memory families list and lowercase family name -> list position index
+        self._families_cached: Optional[List[Dict[str, Any]]] = None
+        self._families_cache_valid_until = 0.0
+        self._families_cache_mtime: Optional[float] = None
+        self._family_index: Dict[str, int] = {}
+        self._families_version = 0
+        
+        # Structure-of-arrays view of the families list for pairing scores
+        self._cat_codes = np.empty(0, dtype=np.int8)
+        self._variant_counts = np.empty(0, dtype=np.int16)
+        self._subset_counts = np.empty(0, dtype=np.int16)
+        
         # Coding-friendly font categories
-        self.coding_fonts = [
-            'Fira Code', 'Source Code Pro', 'JetBrains Mono', 'Roboto Mono',
-            'Ubuntu Mono', 'Inconsolata', 'PT Mono', 'Space Mono', 'IBM Plex Mono'
-        ]
+        self.coding_fonts = list(_CODING_FONTS)
+        self._coding_font_re = re.compile(
+            '|'.join(re.escape(font.lower()) for font in self.coding_fonts) + '|mono|code')
+        
+        # Filtered coding fonts, valid for one families version
+        self._coding_fonts_cache: Optional[List[Dict[str, Any]]] = None
+        self._coding_fonts_cache_version = -1
+        
+        # Shared HTTP session (keep-alive) and CSS fetched by prefetch_previews
+        self._http = requests.Session()
+        self._prefetched_css: Dict[str, str] = {}
         
         print(f"🔤 Fonts API initialized - Cache: {self.cache_dir}")
     
@@ -66,20 +298,35 @@ class FontsAPI:
         - Caching strategies for large datasets
         """
         
+        cache_file = self._families_cache_file
+        cache_mtime = self._get_mtime(cache_file)
+        
+        # Reuse the families already loaded in this process unless the file changed
+        if (self._families_cached is not None and
+                time.time() < self._families_cache_valid_until and
+                cache_mtime in (None, self._families_cache_mtime)):
+            return self._families_cached
+        
+        # A rewritten cache file makes everything derived from the old catalog stale
+        if self._families_cached is not None and cache_mtime not in (None, self._families_cache_mtime):
+            self.invalidate('all')
+        
         # Check if we have cached font data
-        cache_file = self.cache_dir / 'font_families.json'
-        if cache_file.exists():
+        if cache_mtime is not None:
             try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    cached_data = json.load(f)
-                    if self._is_cache_valid(cached_data):
-                        return cached_data['families']
+                cached_data = self._read_cache_file(cache_file)
+                if self._is_cache_valid(cached_data):
+                    self._index_families(cached_data['families'], cached_data['cached_at'])
+                    self._families_cache_mtime = cache_mtime
+                    return cached_data['families']
             except Exception as e:
                 self.logger.error(f"Error loading cached fonts: {e}")
         
         # Fetch from API if no valid cache
         if not self.api_key:
-            return self._get_fallback_fonts()
+            families = self._get_fallback_fonts()
+            self._index_families(families, time.time(), _FALLBACK_FAMILIES_TTL)
+            return self._families_cached
         
         try:
             url = f"{self.base_url}/webfonts"
@@ -88,11 +335,17 @@ class FontsAPI:
                 'sort': sort
             }
             
-            response = requests.get(url, params=params, timeout=15)
-            response.raise_for_status()
-            
-            data = response.json()
-            families = self._process_font_families(data.get('items', []))
+            with self._http.get(url, params=params, timeout=15, stream=True) as response:
+                response.raise_for_status()
+                
+                if ijson is not None:
+                    # Process items as they arrive instead of holding the whole payload
+                    response.raw.decode_content = True
+                    items = ijson.items(response.raw, 'items.item', use_float=True)
+                    families = self._process_font_families(items)
+                else:
+                    data = _loads(response.content)
+                    families = self._process_font_families(data.get('items', []))
             
             # Cache the results
             cache_data = {
@@ -101,15 +354,22 @@ class FontsAPI:
                 'sort': sort
             }
             
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, indent=2)
+            self._write_cache_file(cache_file, cache_data)
+            
+            self._index_families(families, cache_data['cached_at'])
+            self._families_cache_mtime = self._get_mtime(cache_file)
+            
+            # Details (and known misses) describe the previous catalog
+            self.invalidate_font_cache()
             
             self.logger.info(f"Fetched {len(families)} font families")
             return families
             
         except Exception as e:
             self.logger.error(f"Fonts API request failed: {e}")
-            return self._get_fallback_fonts()
+            families = self._get_fallback_fonts()
+            self._index_families(families, time.time(), _FALLBACK_FAMILIES_TTL)
+            return self._families_cached
     
     def get_coding_fonts(self) -> List[Dict[str, Any]]:
         """
@@ -119,32 +379,35 @@ class FontsAPI:
         - Content filtering and categorization
         - Domain-specific recommendations
         - Font characteristic analysis
+        - Memoizing a filter over unchanged input
+        - The coding metadata goes into copies, so the shared families
+          list handed to every other caller stays unchanged
         """
         
         all_fonts = self.get_font_families()
+        
+        # The filter result only changes when the families list does
+        if self._coding_fonts_cache_version == self._families_version:
+            return self._coding_fonts_cache
+        
         coding_fonts = []
         
         # Filter fonts suitable for coding
         for font in all_fonts:
-            family_name = font.get('family', '')
+            family_lower = font.get('family_lower') or font.get('family', '').lower()
             category = font.get('category', '')
             
-            # Check if it's a known coding font
-            if any(coding_font.lower() in family_name.lower() for coding_font in self.coding_fonts):
-                font['recommended_for_coding'] = True
-                coding_fonts.append(font)
-            # Check if it's monospace
-            elif category == 'monospace':
-                font['recommended_for_coding'] = True
-                coding_fonts.append(font)
-            # Check for mono keyword in name
-            elif 'mono' in family_name.lower() or 'code' in family_name.lower():
-                font['recommended_for_coding'] = True
-                coding_fonts.append(font)
-        
-        # Add coding-specific metadata
-        for font in coding_fonts:
-            font.update(self._get_coding_font_features(font['family']))
+            # Monospace category, known coding font or mono/code keyword in name
+            if category == 'monospace' or self._coding_font_re.search(family_lower):
+                # Add coding-specific metadata
+                coding_fonts.append({
+                    **font,
+                    'recommended_for_coding': True,
+                    **self._get_coding_font_features(font['family'])
+                })
+        
+        self._coding_fonts_cache = coding_fonts
+        self._coding_fonts_cache_version = self._families_version
         
         return coding_fonts
     
@@ -158,48 +421,128 @@ class FontsAPI:
         - Typography metadata analysis
         """
         
-        try:
-            # Check cache first
-            cache_key = f"details_{family_name.replace(' ', '_')}"
-            if cache_key in self.font_cache:
-                return self.font_cache[cache_key]
-            
-            # Find font in the families list
-            families = self.get_font_families()
-            font_data = None
-            
-            for family in families:
-                if family['family'].lower() == family_name.lower():
-                    font_data = family
-                    break
-            
-            if not font_data:
-                return self._get_default_font_details(family_name)
-            
-            # Enhance with additional details
-            details = {
-                'family': font_data['family'],
-                'category': font_data['category'],
-                'variants': font_data.get('variants', []),
-                'subsets': font_data.get('subsets', []),
-                'version': font_data.get('version', ''),
-                'last_modified': font_data.get('lastModified', ''),
-                'popularity': families.index(font_data) + 1,
-                'files': font_data.get('files', {}),
-                'download_urls': self._get_download_urls(font_data),
-                'preview_text': self._get_preview_text(font_data['category']),
-                'characteristics': self._analyze_font_characteristics(font_data),
-                'usage_recommendations': self._get_usage_recommendations(font_data)
-            }
-            
-            # Cache the details
-            self.font_cache[cache_key] = details
-            
-            return details
-            
-        except Exception as e:
-            self.logger.error(f"Error getting font details for {family_name}: {e}")
-            return self._get_default_font_details(family_name)
+        return self.get_font_details_batch([family_name])[family_name]
+    
+    def get_font_details_batch(self, names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get detailed information about several font families at once.
+        
+        Learning Notes:
+        - Amortizing one catalog fetch over many lookups
+        - Positive and negative result caching
+        - Per-item error isolation in batch operations
+        """
+        
+        results = {}
+        families = None
+        
+        for family_name in names:
+            try:
+                # Check cache first
+                cache_key = f"details_{family_name.replace(' ', '_')}"
+                if cache_key in self.font_cache:
+                    results[family_name] = self.font_cache[cache_key]
+                    continue
+                
+                # Known misses are cached too, so unknown fonts skip the lookup
+                missing_key = f"details_MISSING_{family_name.replace(' ', '_')}"
+                if missing_key in self.font_cache:
+                    results[family_name] = self.font_cache[missing_key]
+                    continue
+                
+                # Find font in the families list via the lowercase name index
+                if families is None:
+                    families = self.get_font_families()
+                idx = self._family_index.get(family_name.lower())
+                font_data = families[idx] if idx is not None else None
+                
+                if not font_data:
+                    details = self._get_default_font_details(family_name)
+                    self.font_cache[missing_key] = details
+                    results[family_name] = details
+                    continue
+                
+                # Enhance with additional details
+                details = {
+                    'family': font_data['family'],
+                    'category': font_data['category'],
+                    'variants': font_data.get('variants', []),
+                    'subsets': font_data.get('subsets', []),
+                    'version': font_data.get('version', ''),
+                    'last_modified': font_data.get('lastModified', ''),
+                    'popularity': font_data.get('popularity_rank', idx + 1),
+                    'files': font_data.get('files', {}),
+                    'download_urls': self._get_download_urls(font_data),
+                    'preview_text': self._get_preview_text(font_data['category']),
+                    'characteristics': self._analyze_font_characteristics(font_data),
+                    'usage_recommendations': self._get_usage_recommendations(font_data)
+                }
+                
+                # Cache the details
+                self.font_cache[cache_key] = details
+                results[family_name] = details
+                
+            except Exception as e:
+                self.logger.error(f"Error getting font details for {family_name}: {e}")
+                results[family_name] = self._get_default_font_details(family_name)
+        
+        return results
+    
+    def invalidate(self, kind: str = 'all', bypass_disk: bool = False) -> None:
+        """
+        Clear a group of related in-memory caches together.
+        
+        Learning Notes:
+        - Explicit cache invalidation keeps derived caches consistent
+        - 'families' drops the catalog, its index and the coding-fonts filter
+        - 'details' drops cached font details; 'all' clears everything
+        - bypass_disk also deletes the matching cache files, so the next
+          call fetches from the API instead of reloading them
+        """
+        
+        if kind not in ('families', 'details', 'all'):
+            raise ValueError(f"Unknown cache kind: {kind}")
+        
+        if bypass_disk:
+            if kind in ('families', 'all'):
+                self._families_cache_file.unlink(missing_ok=True)
+            if kind in ('details', 'all'):
+                self._details_cache_file.unlink(missing_ok=True)
+        
+        if kind in ('families', 'all'):
+            self._families_cached = None
+            self._families_cache_valid_until = 0.0
+            self._families_cache_mtime = None
+            self._family_index = {}
+            self._cat_codes = np.empty(0, dtype=np.int8)
+            self._variant_counts = np.empty(0, dtype=np.int16)
+            self._subset_counts = np.empty(0, dtype=np.int16)
+            self._coding_fonts_cache = None
+            self._coding_fonts_cache_version = -1
+        
+        if kind in ('details', 'all'):
+            self.invalidate_font_cache()
+        
+        if kind == 'all':
+            self._prefetched_css.clear()
+            _google_fonts_css_url.cache_clear()
+            _build_preview_css.cache_clear()
+    
+    def invalidate_font_cache(self, family_name: Optional[str] = None) -> None:
+        """
+        Drop cached font details, including cached misses.
+        
+        Clears the entries for one family when a name is given,
+        otherwise clears every cached detail.
+        """
+        
+        if family_name is None:
+            self.font_cache.clear()
+            return
+        
+        key_suffix = family_name.replace(' ', '_')
+        self.font_cache.pop(f"details_{key_suffix}", None)
+        self.font_cache.pop(f"details_MISSING_{key_suffix}", None)
     
     def get_font_pairings(self, primary_font: str) -> List[Dict[str, Any]]:
         """
@@ -214,37 +557,49 @@ class FontsAPI:
         primary_details = self.get_font_details(primary_font)
         primary_category = primary_details.get('category', 'sans-serif')
         
-        pairings = []
         all_fonts = self.get_font_families()
         
-        # Pairing rules based on typography principles
-        pairing_rules = {
-            'serif': ['sans-serif', 'display'],
-            'sans-serif': ['serif', 'monospace'],
-            'monospace': ['sans-serif', 'serif'],
-            'display': ['serif', 'sans-serif'],
-            'handwriting': ['serif', 'sans-serif']
-        }
+        target_categories = _PAIRING_RULES.get(primary_category, ('sans-serif',))
+        target_codes = [_CATEGORY_CODES[category] for category in target_categories]
         
-        target_categories = pairing_rules.get(primary_category, ['sans-serif'])
+        # Score the whole catalog at once instead of font by font
+        mask = np.isin(self._cat_codes, target_codes)
+        primary_idx = self._family_index.get(primary_font.lower())
+        if primary_idx is not None:
+            mask[primary_idx] = False
         
-        for font in all_fonts[:50]:  # Limit to top 50 fonts for performance
-            if (font['category'] in target_categories and 
-                font['family'] != primary_font):
-                
-                pairing = {
-                    'secondary_font': font['family'],
-                    'category': font['category'],
-                    'contrast_level': self._calculate_contrast(primary_details, font),
-                    'harmony_score': self._calculate_harmony(primary_details, font),
-                    'use_case': self._suggest_use_case(primary_details, font)
-                }
-                pairings.append(pairing)
+        candidates = np.flatnonzero(mask)
+        if candidates.size == 0:
+            return []
+        
+        # Only matters for rule sets that pair a category with itself
+        primary_code = _CATEGORY_CODES.get(primary_category, -1)
+        
+        variant_weight, subset_weight, popularity_weight, category_weight = _HARMONY_WEIGHTS
+        harmony = 10 * (
+            variant_weight * np.minimum(self._variant_counts[candidates], 18) / 18 +
+            subset_weight * np.minimum(self._subset_counts[candidates], 10) / 10 +
+            popularity_weight * (1 - candidates / len(all_fonts)) +
+            category_weight * (self._cat_codes[candidates] == primary_code)
+        )
         
-        # Sort by harmony score
-        pairings.sort(key=lambda x: x['harmony_score'], reverse=True)
+        # Top 10 by harmony score without sorting every candidate
+        top_n = min(10, candidates.size)
+        best = np.argpartition(-harmony, top_n - 1)[:top_n]
+        best = best[np.argsort(-harmony[best], kind='stable')]
         
-        return pairings[:10]  # Return top 10 pairings
+        pairings = []
+        for i in best:
+            font = all_fonts[candidates[i]]
+            pairings.append({
+                'secondary_font': font['family'],
+                'category': font['category'],
+                'contrast_level': self._calculate_contrast(primary_details, font),
+                'harmony_score': round(float(harmony[i]), 1),
+                'use_case': self._suggest_use_case(primary_details, font)
+            })
+        
+        return pairings
     
     def generate_font_preview(self, font_family: str, text: str, size: int = 14) -> str:
         """
@@ -256,30 +611,54 @@ class FontsAPI:
         - Dynamic styling creation
         """
         
-        font_details = self.get_font_details(font_family)
-        google_fonts_url = self._get_google_fonts_css_url(font_family)
+        # Resolve the category through the family index
+        families = self.get_font_families()
+        idx = self._family_index.get(font_family.lower())
+        category = families[idx].get('category', 'sans-serif') if idx is not None else 'sans-serif'
         
-        css = f"""
-        @import url('{google_fonts_url}');
-        
-        .font-preview-{font_family.replace(' ', '-').lower()} {{
-            font-family: '{font_family}', {font_details.get('category', 'sans-serif')};
-            font-size: {size}px;
-            line-height: 1.4;
-            margin: 10px 0;
-            padding: 15px;
-            border: 1px solid #e0e0e0;
-            border-radius: 4px;
-            background: #f9f9f9;
-        }}
+        return _build_preview_css(font_family, category, size,
+                                  self._prefetched_css.get(font_family))
+    
+    async def prefetch_previews(self, families: List[str]) -> Dict[str, str]:
+        """
+        Fetch the families catalog and Google Fonts CSS for several families concurrently.
         
-        .font-preview-{font_family.replace(' ', '-').lower()}:hover {{
-            background: #f0f0f0;
-            border-color: #c0c0c0;
-        }}
+        Learning Notes:
+        - asyncio concurrency for I/O-bound work
+        - Bounding parallel requests with a semaphore
+        - Warming caches ahead of UI rendering
         """
         
-        return css
+        if aiohttp is None:
+            self.logger.warning("aiohttp is not installed - skipping font preview prefetch")
+            return {}
+        
+        # Load the catalog on a worker thread while the CSS requests run
+        loop = asyncio.get_running_loop()
+        catalog_task = loop.run_in_executor(None, self.get_font_families)
+        
+        semaphore = asyncio.Semaphore(8)
+        timeout = aiohttp.ClientTimeout(total=15)
+        
+        async def fetch_css(session, family: str):
+            async with semaphore:
+                try:
+                    async with session.get(self._get_google_fonts_css_url(family)) as response:
+                        response.raise_for_status()
+                        return family, await response.text()
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    self.logger.error(f"Font CSS prefetch failed for {family}: {e}")
+                    return family, None
+        
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            results = await asyncio.gather(*(fetch_css(session, family) for family in families))
+        
+        await catalog_task
+        
+        prefetched = {family: css for family, css in results if css}
+        self._prefetched_css.update(prefetched)
+        
+        return prefetched
     
     def get_system_fonts(self) -> List[Dict[str, Any]]:
         """
@@ -291,125 +670,173 @@ class FontsAPI:
         - Fallback font management
         """
         
-        system_fonts = [
-            {
-                'family': 'Arial',
-                'category': 'sans-serif',
-                'system': True,
-                'platforms': ['Windows', 'macOS', 'Linux'],
-                'suitable_for_coding': False
-            },
-            {
-                'family': 'Times New Roman',
-                'category': 'serif',
-                'system': True,
-                'platforms': ['Windows', 'macOS'],
-                'suitable_for_coding': False
-            },
-            {
-                'family': 'Courier New',
-                'category': 'monospace',
-                'system': True,
-                'platforms': ['Windows', 'macOS', 'Linux'],
-                'suitable_for_coding': True
-            },
-            {
-                'family': 'Helvetica',
-                'category': 'sans-serif',
-                'system': True,
-                'platforms': ['macOS', 'Linux'],
-                'suitable_for_coding': False
-            },
-            {
-                'family': 'Monaco',
-                'category': 'monospace',
-                'system': True,
-                'platforms': ['macOS'],
-                'suitable_for_coding': True
-            },
-            {
-                'family': 'Consolas',
-                'category': 'monospace',
-                'system': True,
-                'platforms': ['Windows'],
-                'suitable_for_coding': True
-            },
-            {
-                'family': 'DejaVu Sans Mono',
-                'category': 'monospace',
-                'system': True,
-                'platforms': ['Linux'],
-                'suitable_for_coding': True
-            }
-        ]
-        
-        return system_fonts
+        return list(_SYSTEM_FONTS)
     
-    def _process_font_families(self, families_data: List[Dict]) -> List[Dict[str, Any]]:
+    def _process_font_families(self, families_data: Iterable[Dict]) -> List[Dict[str, Any]]:
         """Process and enhance font families data from API."""
         
         processed = []
         
         for family in families_data:
+            category = family.get('category')
+            family_name = family.get('family', '')
             processed_family = {
-                'family': family.get('family', ''),
-                'category': family.get('category', 'sans-serif'),
+                'family': family_name,
+                'family_lower': family_name.lower(),
+                'category': category or 'sans-serif',
                 'variants': family.get('variants', []),
                 'subsets': family.get('subsets', []),
                 'version': family.get('version', ''),
                 'lastModified': family.get('lastModified', ''),
                 'files': family.get('files', {}),
                 'popularity_rank': len(processed) + 1,
-                'suitable_for_ui': self._is_suitable_for_ui(family),
-                'suitable_for_headings': self._is_suitable_for_headings(family),
-                'suitable_for_body': self._is_suitable_for_body(family)
+                'suitable_for_ui': category in _UI_CATS,
+                'suitable_for_headings': category in _HEAD_CATS,
+                'suitable_for_body': category in _BODY_CATS
             }
             processed.append(processed_family)
         
         return processed
     
+    def _index_families(self, families: List[Dict[str, Any]],
+                        cached_at: Optional[Any] = None,
+                        ttl: float = _FAMILIES_CACHE_TTL) -> None:
+        """Remember the loaded families list and rebuild the name index if it changed."""
+        
+        if cached_at is not None:
+            self._families_cache_valid_until = self._cache_epoch(cached_at) + ttl
+        else:
+            self._families_cache_valid_until = 0.0
+        
+        # An unchanged list keeps its index, arrays and version (and so the
+        # memoized coding fonts)
+        if families == self._families_cached:
+            return
+        
+        self._families_cached = families
+        self._families_version += 1
+        self._family_index = {
+            family.get('family_lower') or family.get('family', '').lower(): idx
+            for idx, family in enumerate(families)
+        }
+        
+        count = len(families)
+        self._cat_codes = np.fromiter(
+            (_CATEGORY_CODES.get(family.get('category'), -1) for family in families),
+            dtype=np.int8, count=count)
+        self._variant_counts = np.fromiter(
+            (len(family.get('variants', ())) for family in families),
+            dtype=np.int16, count=count)
+        self._subset_counts = np.fromiter(
+            (len(family.get('subsets', ())) for family in families),
+            dtype=np.int16, count=count)
+    
     def _get_coding_font_features(self, font_family: str) -> Dict[str, Any]:
         """Get coding-specific features for a font."""
         
-        features = {
-            'ligatures_support': False,
-            'zero_distinction': False,
-            'readability_score': 7,  # Default score out of 10
-            'best_sizes': [10, 11, 12, 13, 14],
-            'recommended_line_height': 1.4
-        }
+        features = dict(_CODING_FONT_FEATURES_BASE)
         
         # Known features for specific fonts
-        font_lower = font_family.lower()
-        
-        if 'fira code' in font_lower:
-            features.update({
-                'ligatures_support': True,
-                'zero_distinction': True,
-                'readability_score': 9,
-                'best_sizes': [10, 11, 12, 13, 14, 15, 16]
-            })
-        elif 'jetbrains mono' in font_lower:
-            features.update({
-                'ligatures_support': True,
-                'zero_distinction': True,
-                'readability_score': 9,
-                'best_sizes': [10, 11, 12, 13, 14, 15]
-            })
-        elif 'source code pro' in font_lower:
-            features.update({
-                'zero_distinction': True,
-                'readability_score': 8,
-                'best_sizes': [10, 11, 12, 13, 14]
-            })
-        elif 'inconsolata' in font_lower:
-            features.update({
-                'readability_score': 8,
-                'best_sizes': [11, 12, 13, 14, 15]
-            })
+        overrides = _CODING_FONT_SPECIAL.get(font_family.lower())
+        if overrides:
+            features.update(overrides)
         
         return features
     
+    def _get_default_font_details(self, family_name: str) -> Dict[str, Any]:
+        """Describe a family that is not in the catalog with neutral defaults."""
+        
+        return {
+            'family': family_name,
+            'category': 'sans-serif',
+            'variants': ['regular'],
+            'subsets': [],
+            'version': '',
+            'last_modified': '',
+            'popularity': None,
+            'files': {},
+            'download_urls': {},
+            'preview_text': self._get_preview_text('sans-serif'),
+            'characteristics': {},
+            'usage_recommendations': [],
+            'found': False
+        }
+    
+    def _get_download_urls(self, font_data: Dict[str, Any]) -> Dict[str, str]:
+        """Map each variant to its font file URL, always over HTTPS."""
+        
+        return {
+            variant: url.replace('http://', 'https://', 1)
+            for variant, url in font_data.get('files', {}).items()
+        }
+    
+    def _get_preview_text(self, category: str) -> str:
+        """Pick preview sample text suited to a font category."""
+        return _PREVIEW_TEXTS.get(category, _PREVIEW_TEXTS['sans-serif'])
+    
+    def _analyze_font_characteristics(self, font_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Summarize weights, styles and language coverage from the variant list."""
+        
+        variants = font_data.get('variants', [])
+        
+        # Variants look like 'regular', 'italic', '700' or '700italic'
+        weights = sorted({
+            400 if variant in ('regular', 'italic') else int(variant.replace('italic', ''))
+            for variant in variants
+            if variant in ('regular', 'italic') or variant.replace('italic', '').isdigit()
+        })
+        
+        return {
+            'weights': weights,
+            'weight_range': (weights[0], weights[-1]) if weights else None,
+            'has_italic': any('italic' in variant for variant in variants),
+            'variant_count': len(variants),
+            'subset_count': len(font_data.get('subsets', [])),
+            'monospace': font_data.get('category') == 'monospace'
+        }
+    
+    def _get_usage_recommendations(self, font_data: Dict[str, Any]) -> List[str]:
+        """Suggest where a font works well, based on its category."""
+        
+        recommendations = []
+        if self._is_suitable_for_ui(font_data):
+            recommendations.append('User interface elements')
+        if self._is_suitable_for_headings(font_data):
+            recommendations.append('Headings and titles')
+        if self._is_suitable_for_body(font_data):
+            recommendations.append('Body text')
+        if font_data.get('category') == 'monospace':
+            recommendations.append('Code editors and terminals')
+        return recommendations
+    
+    def _calculate_contrast(self, primary: Dict[str, Any], secondary: Dict[str, Any]) -> str:
+        """Rate how strongly two fonts contrast, from their categories."""
+        
+        categories = {primary.get('category'), secondary.get('category')}
+        if len(categories) == 1:
+            return 'Low'
+        if categories & {'display', 'handwriting'} or categories == {'serif', 'sans-serif'}:
+            return 'High'
+        return 'Medium'
+    
+    def _suggest_use_case(self, primary: Dict[str, Any], secondary: Dict[str, Any]) -> str:
+        """Describe how a pair of fonts could share the work."""
+        
+        primary_name = primary.get('family', 'Primary font')
+        secondary_name = secondary.get('family', 'Secondary font')
+        primary_category = primary.get('category')
+        secondary_category = secondary.get('category')
+        
+        if secondary_category == 'monospace':
+            return f"Code samples in {secondary_name} alongside {primary_name} text"
+        if primary_category == 'monospace':
+            return f"Code in {primary_name}, surrounding text in {secondary_name}"
+        if secondary_category == 'display':
+            return f"Headings in {secondary_name}, body text in {primary_name}"
+        if primary_category in ('serif', 'display', 'handwriting'):
+            return f"Headings in {primary_name}, body text in {secondary_name}"
+        return f"Body text in {primary_name}, headings in {secondary_name}"
+    
     def _get_fallback_fonts(self) -> List[Dict[str, Any]]:
         """Return fallback font list when API is unavailable."""
         
@@ -438,26 +865,42 @@ class FontsAPI:
     def _is_cache_valid(self, cached_data: Dict) -> bool:
         """Check if cached font data is still valid."""
         
+        cached_at = self._cache_epoch(cached_data.get('cached_at', 0))
+        return time.time() - cached_at < _FAMILIES_CACHE_TTL
+    
+    def _cache_epoch(self, cached_at: Any) -> float:
+        """Convert a cache timestamp (epoch seconds or legacy ISO string) to epoch seconds."""
+        
+        try:
+            return float(cached_at)
+        except (TypeError, ValueError):
+            pass
+        
         try:
-            from datetime import datetime, timedelta
-            cached_time = datetime.fromisoformat(cached_data.get('cached_at', ''))
-            return datetime.now() - cached_time < timedelta(days=7)  # Cache for 7 days
-        except:
-            return False
+            from datetime import datetime
+            return datetime.fromisoformat(cached_at).timestamp()
+        except (TypeError, ValueError):
+            return 0.0
     
-    def _get_current_timestamp(self) -> str:
-        """Get current timestamp in ISO format."""
-        from datetime import datetime
-        return datetime.now().isoformat()
+    def _get_mtime(self, path: Path) -> Optional[float]:
+        """Return a file's modification time, or None if it does not exist."""
+        
+        try:
+            return path.stat().st_mtime
+        except OSError:
+            return None
+    
+    def _get_current_timestamp(self) -> float:
+        """Get current timestamp as Unix epoch seconds."""
+        return time.time()
     
     def load_cached_fonts(self) -> None:
         """Load cached font details from disk."""
         
-        cache_file = self.cache_dir / 'font_details_cache.json'
+        cache_file = self._details_cache_file
         if cache_file.exists():
             try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    self.font_cache = json.load(f)
+                self.font_cache = self._read_cache_file(cache_file)
             except Exception as e:
                 self.logger.error(f"Error loading font cache: {e}")
                 self.font_cache = {}
@@ -465,28 +908,52 @@ class FontsAPI:
     def save_font_cache(self) -> None:
         """Save font details cache to disk."""
         
-        cache_file = self.cache_dir / 'font_details_cache.json'
+        cache_file = self._details_cache_file
         try:
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(self.font_cache, f, indent=2)
+            self._write_cache_file(cache_file, self.font_cache)
         except Exception as e:
             self.logger.error(f"Error saving font cache: {e}")
     
+    def _read_cache_file(self, cache_file: Path) -> Any:
+        """Read a gzip-compressed JSON cache file."""
+        
+        with gzip.open(cache_file, 'rb') as f:
+            return _loads(f.read())
+    
+    def _write_cache_file(self, cache_file: Path, data: Any) -> None:
+        """
+        Write a gzip-compressed JSON cache file atomically.
+        
+        The data goes to a uniquely named temporary file first and is then
+        swapped in, so a crash mid-write never leaves a truncated cache
+        behind and concurrent writers never share a temporary file.
+        """
+        
+        pretty = self.config.get('debug_pretty_caches', False)
+        
+        with tempfile.NamedTemporaryFile(dir=cache_file.parent, prefix=cache_file.name,
+                                         suffix='.tmp', delete=False) as raw:
+            tmp_file = raw.name
+        try:
+            with gzip.open(tmp_file, 'wb', compresslevel=3) as f:
+                f.write(_dumps(data, pretty))
+            os.replace(tmp_file, cache_file)
+        except BaseException:
+            Path(tmp_file).unlink(missing_ok=True)
+            raise
+    
     def _get_google_fonts_css_url(self, font_family: str) -> str:
         """Generate Google Fonts CSS URL for a font family."""
-        
-        base_url = "https://fonts.googleapis.com/css2"
-        family_param = font_family.replace(' ', '+')
-        return f"{base_url}?family={family_param}:wght@400;700&display=swap"
+        return _google_fonts_css_url(font_family)
     
     def _is_suitable_for_ui(self, font_data: Dict) -> bool:
         """Determine if font is suitable for UI elements."""
-        return font_data.get('category') in ['sans-serif', 'display']
+        return font_data.get('category') in _UI_CATS
     
     def _is_suitable_for_headings(self, font_data: Dict) -> bool:
         """Determine if font is suitable for headings."""
-        return font_data.get('category') in ['serif', 'sans-serif', 'display']
+        return font_data.get('category') in _HEAD_CATS
     
     def _is_suitable_for_body(self, font_data: Dict) -> bool:
         """Determine if font is suitable for body text."""
-        return font_data.get('category') in ['serif', 'sans-serif'] 
\ No newline at end of file
+        return font_data.get('category') in _BODY_CATS 
\ No newline at end of file
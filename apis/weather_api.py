@@ -9,12 +9,193 @@ Learning Notes:
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import asyncio
 import json
 import logging
-from typing import Dict, Any, Optional, List
+import re
+import sqlite3
+import threading
+import time
+import numpy as np
+from collections import Counter, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, Any, Optional, List, Tuple
+from urllib.parse import quote
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from utils.config import Config
 
+# Fast JSON decoding straight from response bytes, with the standard library as fallback
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Optional HTTP/2 client; requests (HTTP/1.1) is used when it is missing
+try:
+    import httpx
+    import h2  # noqa: F401 - required by httpx for http2=True
+except ImportError:
+    httpx = None
+
+# Brotli-compressed responses can be decoded by requests, httpx and aiohttp
+# whenever the brotli package is installed
+try:
+    import brotli  # noqa: F401
+except ImportError:
+    brotli = None
+
+_ACCEPT_ENCODING = 'gzip, br' if brotli else 'gzip'
+
+# Network failures from whichever HTTP client is in use
+_HTTP_ERRORS = (requests.exceptions.RequestException,) + ((httpx.HTTPError,) if httpx else ())
+
+# Optional async HTTP client used by AsyncWeatherAPI
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+_ASYNC_HTTP_ERRORS = ((aiohttp.ClientError,) if aiohttp else ()) + (asyncio.TimeoutError,)
+
+# Malformed or unexpected payloads; anything else is a bug and should surface
+_PAYLOAD_ERRORS = (AttributeError, LookupError, TypeError, ValueError)
+
+# Shared read-only stand-in for missing sections of an API payload
+_EMPTY = MappingProxyType({})
+
+# Weather condition keywords, matched case-insensitively in one scan
+_CONDITION_RE = re.compile(r'(rain|snow|clear|sun)', re.IGNORECASE)
+
+# Prebuilt recommendation groups, picked by temperature, condition and humidity
+_COLD_RECS = (
+    "🔥 Cold weather detected! Perfect time for hot coffee and intense coding sessions.",
+    "💡 Consider working on performance optimizations - your mind is sharp in cold weather!",
+)
+_HOT_RECS = (
+    "🌞 Hot weather! Stay hydrated and consider shorter coding sessions.",
+    "🏖️ Maybe it's time to work on that mobile app for beach activities?",
+)
+_MILD_RECS = ("🌤️ Perfect weather for productive coding! Great conditions for focused work.",)
+_SUN_RECS = (
+    "☀️ Sunny day! Great for pair programming or outdoor coding sessions.",
+    "🌅 Consider working on UI/UX - bright weather inspires creative design!",
+)
+_CONDITION_RECS = {
+    'rain': (
+        "🌧️ Rainy day perfect for indoor coding! Great time for documentation and refactoring.",
+        "☔ Consider working on your backup and sync systems while it's raining outside.",
+    ),
+    'snow': ("❄️ Snowy weather! Perfect time for algorithm challenges and deep learning.",),
+    'clear': _SUN_RECS,
+    'sun': _SUN_RECS,
+}
+_HUMID_RECS = ("💨 High humidity detected! Make sure your equipment stays cool.",)
+_DRY_RECS = ("🌵 Low humidity! Stay hydrated and protect your electronics from static.",)
+
+# Time-of-day recommendation for each hour (None outside the buckets)
+_HOUR_BUCKET: List[Optional[str]] = [None] * 24
+for _hour in range(6, 11):
+    _HOUR_BUCKET[_hour] = "🌅 Morning hours! Best time for complex problem-solving and architecture design."
+for _hour in range(14, 18):
+    _HOUR_BUCKET[_hour] = "☕ Afternoon productivity! Great time for testing and debugging."
+for _hour in range(18, 23):
+    _HOUR_BUCKET[_hour] = "🌙 Evening coding! Perfect for creative projects and experimentation."
+del _hour
+
+# Fixed parts of the fallback payloads served while the API is unavailable
+_FALLBACK_WEATHER = MappingProxyType({
+    'country': '',
+    'temperature': 20.0,
+    'feels_like': 20.0,
+    'humidity': 50,
+    'pressure': 1013,
+    'condition': 'Unknown',
+    'description': 'Weather data unavailable',
+    'icon': '01d',
+    'wind_speed': 0,
+    'wind_direction': 0,
+    'visibility': 10,
+    'uv_index': 0,
+    'fallback': True
+})
+_FALLBACK_FORECAST_DAY = MappingProxyType({
+    'min_temp': 15.0,
+    'max_temp': 25.0,
+    'avg_temp': 20.0,
+    'condition': 'Unknown',
+    'avg_humidity': 50,
+    'description': 'Weather data unavailable'
+})
+_FALLBACK_AIR_QUALITY = MappingProxyType({
+    'aqi': 3,
+    'description': 'Moderate',
+    'fallback': True
+})
+
+# (epoch second, ISO timestamp) shared by fallbacks created within that second
+_now_iso_cache = (0, '')
+
+def _now_iso() -> str:
+    """Current time as an ISO string, formatted at most once per second."""
+    global _now_iso_cache
+    second = int(time.time())
+    if _now_iso_cache[0] != second:
+        _now_iso_cache = (second, datetime.now().isoformat())
+    return _now_iso_cache[1]
+
+@dataclass(frozen=True)
+class CurrentWeather:
+    """
+    Current conditions for one location.
+    
+    Learning Notes:
+    - __slots__ drops the per-instance __dict__, so each cached result is
+      about half the size of the equivalent dict
+    - get(), [] and `in` keep existing dict-style callers working
+    """
+    
+    __slots__ = ('location', 'country', 'temperature', 'feels_like', 'humidity',
+                 'pressure', 'condition', 'description', 'icon', 'wind_speed',
+                 'wind_direction', 'visibility', 'uv_index', 'last_updated', 'fallback')
+    
+    location: str
+    country: str
+    temperature: float
+    feels_like: float
+    humidity: float
+    pressure: float
+    condition: str
+    description: str
+    icon: str
+    wind_speed: float
+    wind_direction: float
+    visibility: float
+    uv_index: float
+    last_updated: str
+    fallback: bool
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style field access."""
+        return getattr(self, key) if key in self.__slots__ else default
+    
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self.__slots__
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict copy for JSON serialization."""
+        return asdict(self)
+
 class WeatherAPI:
     """
     Weather API integration for development environment enhancement.
@@ -38,16 +219,69 @@ class WeatherAPI:
         self.base_url = config.get('api_endpoints', {}).get('weather', 
                                  'https://api.openweathermap.org/data/2.5')
         
+        # Static part of each query string, encoded once; requests only
+        # append the encoded location (or coordinates)
+        appid = quote(self.api_key or '', safe='')
+        self._current_url_prefix = f"{self.base_url}/weather?appid={appid}&units=metric&q="
+        self._forecast_url_prefix = f"{self.base_url}/forecast?appid={appid}&units=metric&cnt={{}}&q="
+        self._geo_url_prefix = f"http://api.openweathermap.org/geo/1.0/direct?appid={appid}&limit={{}}&q="
+        self._air_quality_url_prefix = f"{self.base_url}/air_pollution?appid={appid}"
+        
         # Cache configuration
         self.cache_duration = timedelta(minutes=30)  # Cache for 30 minutes
-        self.cache = {}
+        self.cache_max_entries = 1024  # Least recently used entries are evicted beyond this
+        self.cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        # Persistent copy of the cache so restarts don't re-hit the API
+        self.cache_db_path = Path.home() / '.codemaster_pro' / 'weather_cache.db'
+        self._disk_cache = None
+        self._disk_lock = threading.Lock()
+        self._open_disk_cache()
+        
+        # Location -> (lat, lon, expiry); coordinates barely ever change
+        self.geocode_duration = timedelta(days=7)
+        self._geocode_cache: Dict[str, tuple] = {}
+        
+        # In-flight fetches keyed like the cache, for request coalescing
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        
+        # Pooled HTTP client so repeated requests reuse connections;
+        # over HTTP/2 concurrent requests share a single connection
+        headers = {
+            'Accept-Encoding': _ACCEPT_ENCODING,
+            'User-Agent': 'CodeMasterPro/1.0',
+            'Connection': 'keep-alive'
+        }
+        if httpx is not None:
+            self.client = httpx.Client(
+                transport=httpx.HTTPTransport(
+                    http2=True,
+                    retries=3,
+                    limits=httpx.Limits(max_connections=10, max_keepalive_connections=10)
+                ),
+                headers=headers,
+                timeout=10.0
+            )
+        else:
+            self.client = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=16,
+                pool_maxsize=32,
+                max_retries=Retry(total=3, backoff_factor=0.3,
+                                  status_forcelist=(429, 500, 502, 503, 504))
+            )
+            self.client.mount('http://', adapter)
+            self.client.mount('https://', adapter)
+            self.client.headers.update(headers)
         
         # Default location
         self.default_location = config.get('weather_location', 'New York')
         
         print(f"🌤️ Weather API initialized - Default location: {self.default_location}")
     
-    def get_current_weather(self, location: Optional[str] = None) -> Dict[str, Any]:
+    def get_current_weather(self, location: Optional[str] = None) -> CurrentWeather:
         """
         Get current weather data for a location.
         
@@ -62,42 +296,47 @@ class WeatherAPI:
         
         # Check cache first
         cache_key = f"current_{location}"
-        if self._is_cached_valid(cache_key):
-            self.logger.debug(f"Returning cached weather data for {location}")
-            return self.cache[cache_key]['data']
+        entry = self._get_cached(cache_key)
+        if entry is not None:
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Returning cached weather data for {location}")
+            return entry['data']
         
         if not self.api_key:
             return self._get_fallback_weather(location)
         
+        # Concurrent callers for the same location share one request
+        return self._single_flight(cache_key, lambda: self._fetch_current_weather(location, cache_key))
+    
+    def _fetch_current_weather(self, location: str, cache_key: str) -> CurrentWeather:
+        """Fetch, transform and cache current weather for a location."""
+        
         try:
-            # Build API request URL
-            url = f"{self.base_url}/weather"
-            params = {
-                'q': location,
-                'appid': self.api_key,
-                'units': 'metric'  # Celsius temperature
-            }
+            # Build API request URL (metric units for Celsius temperature)
+            url = self._current_url_prefix + quote(location, safe='')
             
-            # Make API request
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
+            # Make API request, revalidating any stale cached copy
+            response, revalidated = self._conditional_get(cache_key, url)
+            if revalidated is not None:
+                return revalidated['data']
             
             # Parse response
-            data = response.json()
+            data = _loads(response.content)
             
             # Transform to our format
-            weather_data = self._transform_current_weather(data)
+            now = datetime.now()
+            weather_data = self._transform_current_weather(data, now)
             
             # Cache the result
-            self._cache_data(cache_key, weather_data)
+            self._cache_data(cache_key, weather_data, response, now)
             
             self.logger.info(f"Weather data fetched for {location}")
             return weather_data
             
-        except requests.exceptions.RequestException as e:
+        except _HTTP_ERRORS as e:
             self.logger.error(f"Weather API request failed: {e}")
             return self._get_fallback_weather(location)
-        except Exception as e:
+        except _PAYLOAD_ERRORS as e:
             self.logger.error(f"Weather data processing failed: {e}")
             return self._get_fallback_weather(location)
     
@@ -115,34 +354,40 @@ class WeatherAPI:
         
         # Check cache
         cache_key = f"forecast_{location}_{days}"
-        if self._is_cached_valid(cache_key):
-            return self.cache[cache_key]['data']
+        entry = self._get_cached(cache_key)
+        if entry is not None:
+            return entry['data']
         
         if not self.api_key:
             return self._get_fallback_forecast(location, days)
         
+        return self._single_flight(cache_key, lambda: self._fetch_forecast(location, days, cache_key))
+    
+    def _fetch_forecast(self, location: str, days: int, cache_key: str) -> Dict[str, Any]:
+        """Fetch, transform and cache the forecast for a location."""
+        
         try:
-            url = f"{self.base_url}/forecast"
-            params = {
-                'q': location,
-                'appid': self.api_key,
-                'units': 'metric',
-                'cnt': days * 8  # 8 forecasts per day (3-hour intervals)
-            }
+            # 8 forecasts per day (3-hour intervals)
+            url = self._forecast_url_prefix.format(days * 8) + quote(location, safe='')
             
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
+            response, revalidated = self._conditional_get(cache_key, url)
+            if revalidated is not None:
+                return revalidated['data']
             
-            data = response.json()
-            forecast_data = self._transform_forecast(data, days)
+            data = _loads(response.content)
+            now = datetime.now()
+            forecast_data = self._transform_forecast(data, days, now)
             
-            self._cache_data(cache_key, forecast_data)
+            self._cache_data(cache_key, forecast_data, response, now)
             
             return forecast_data
             
-        except Exception as e:
+        except _HTTP_ERRORS as e:
             self.logger.error(f"Forecast API request failed: {e}")
             return self._get_fallback_forecast(location, days)
+        except _PAYLOAD_ERRORS as e:
+            self.logger.error(f"Forecast data processing failed: {e}")
+            return self._get_fallback_forecast(location, days)
     
     def get_development_recommendations(self, weather_data: Dict[str, Any]) -> List[str]:
         """
@@ -154,178 +399,315 @@ class WeatherAPI:
         - User experience enhancement features
         """
         
+        temperature = weather_data.get('temperature', 20)
+        humidity = weather_data.get('humidity', 50)
+        match = _CONDITION_RE.search(weather_data.get('condition') or '')
+        
         recommendations = []
+        recommendations.extend(_COLD_RECS if temperature < 10 else
+                               _HOT_RECS if temperature > 30 else _MILD_RECS)
+        if match:
+            recommendations.extend(_CONDITION_RECS[match.group(1).lower()])
+        recommendations.extend(_HUMID_RECS if humidity > 80 else
+                               _DRY_RECS if humidity < 30 else ())
         
-        try:
-            temperature = weather_data.get('temperature', 20)
-            condition = weather_data.get('condition', '').lower()
-            humidity = weather_data.get('humidity', 50)
-            
-            # Temperature-based recommendations
-            if temperature < 10:
-                recommendations.append("🔥 Cold weather detected! Perfect time for hot coffee and intense coding sessions.")
-                recommendations.append("💡 Consider working on performance optimizations - your mind is sharp in cold weather!")
-            elif temperature > 30:
-                recommendations.append("🌞 Hot weather! Stay hydrated and consider shorter coding sessions.")
-                recommendations.append("🏖️ Maybe it's time to work on that mobile app for beach activities?")
-            else:
-                recommendations.append("🌤️ Perfect weather for productive coding! Great conditions for focused work.")
-            
-            # Weather condition recommendations
-            if 'rain' in condition:
-                recommendations.append("🌧️ Rainy day perfect for indoor coding! Great time for documentation and refactoring.")
-                recommendations.append("☔ Consider working on your backup and sync systems while it's raining outside.")
-            elif 'snow' in condition:
-                recommendations.append("❄️ Snowy weather! Perfect time for algorithm challenges and deep learning.")
-            elif 'clear' in condition or 'sun' in condition:
-                recommendations.append("☀️ Sunny day! Great for pair programming or outdoor coding sessions.")
-                recommendations.append("🌅 Consider working on UI/UX - bright weather inspires creative design!")
-            
-            # Humidity recommendations
-            if humidity > 80:
-                recommendations.append("💨 High humidity detected! Make sure your equipment stays cool.")
-            elif humidity < 30:
-                recommendations.append("🌵 Low humidity! Stay hydrated and protect your electronics from static.")
-            
-            # Time-based recommendations
-            current_hour = datetime.now().hour
-            if 6 <= current_hour <= 10:
-                recommendations.append("🌅 Morning hours! Best time for complex problem-solving and architecture design.")
-            elif 14 <= current_hour <= 17:
-                recommendations.append("☕ Afternoon productivity! Great time for testing and debugging.")
-            elif 18 <= current_hour <= 22:
-                recommendations.append("🌙 Evening coding! Perfect for creative projects and experimentation.")
-            
-        except Exception as e:
-            self.logger.error(f"Error generating recommendations: {e}")
-            recommendations.append("🤖 Unable to generate weather-based recommendations, but coding is always a good idea!")
+        hour_recommendation = _HOUR_BUCKET[datetime.now().hour]
+        if hour_recommendation:
+            recommendations.append(hour_recommendation)
         
         return recommendations
     
-    def _transform_current_weather(self, api_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _transform_current_weather(self, api_data: Dict[str, Any],
+                                   now: Optional[datetime] = None) -> CurrentWeather:
         """Transform API response to our internal format."""
         
-        return {
-            'location': api_data.get('name', 'Unknown'),
-            'country': api_data.get('sys', {}).get('country', ''),
-            'temperature': round(api_data.get('main', {}).get('temp', 0), 1),
-            'feels_like': round(api_data.get('main', {}).get('feels_like', 0), 1),
-            'humidity': api_data.get('main', {}).get('humidity', 0),
-            'pressure': api_data.get('main', {}).get('pressure', 0),
-            'condition': api_data.get('weather', [{}])[0].get('main', 'Unknown'),
-            'description': api_data.get('weather', [{}])[0].get('description', ''),
-            'icon': api_data.get('weather', [{}])[0].get('icon', ''),
-            'wind_speed': api_data.get('wind', {}).get('speed', 0),
-            'wind_direction': api_data.get('wind', {}).get('deg', 0),
-            'visibility': api_data.get('visibility', 0) / 1000,  # Convert to km
-            'uv_index': api_data.get('uvi', 0),
-            'last_updated': datetime.now().isoformat()
-        }
+        now = now or datetime.now()
+        
+        # Resolve each nested section once; missing ones share _EMPTY
+        main = api_data.get('main') or _EMPTY
+        weather = (api_data.get('weather') or (_EMPTY,))[0]
+        wind = api_data.get('wind') or _EMPTY
+        sys_info = api_data.get('sys') or _EMPTY
+        
+        return CurrentWeather(
+            location=api_data.get('name', 'Unknown'),
+            country=sys_info.get('country', ''),
+            temperature=round(main.get('temp', 0), 1),
+            feels_like=round(main.get('feels_like', 0), 1),
+            humidity=main.get('humidity', 0),
+            pressure=main.get('pressure', 0),
+            condition=weather.get('main', 'Unknown'),
+            description=weather.get('description', ''),
+            icon=weather.get('icon', ''),
+            wind_speed=wind.get('speed', 0),
+            wind_direction=wind.get('deg', 0),
+            visibility=api_data.get('visibility', 0) / 1000,  # Convert to km
+            uv_index=api_data.get('uvi', 0),
+            last_updated=now.isoformat(),
+            fallback=False
+        )
     
-    def _transform_forecast(self, api_data: Dict[str, Any], days: int) -> Dict[str, Any]:
+    def _transform_forecast(self, api_data: Dict[str, Any], days: int,
+                            now: Optional[datetime] = None) -> Dict[str, Any]:
         """Transform forecast API response to our internal format."""
         
-        forecasts = []
-        daily_data = {}
+        now = now or datetime.now()
+        items = api_data.get('list', [])
+        count = len(items)
+        
+        # One pass fills flat arrays; dates are numbered in first-seen order
+        temperatures = np.empty(count)
+        humidity = np.empty(count)
+        day_idx = np.empty(count, dtype=np.int16)
+        conditions = []
+        descriptions = []
+        dates = {}
         
-        for item in api_data.get('list', []):
+        for i, item in enumerate(items):
             date_str = item['dt_txt'].split(' ')[0]
+            day_idx[i] = dates.setdefault(date_str, len(dates))
+            temperatures[i] = item['main']['temp']
+            humidity[i] = item['main']['humidity']
+            conditions.append(item['weather'][0]['main'])
+            descriptions.append(item['weather'][0]['description'])
+        
+        forecasts = []
+        
+        if count:
+            # Group entries by day, then reduce each contiguous group
+            order = np.argsort(day_idx, kind='stable')
+            day_idx = day_idx[order]
+            temperatures = temperatures[order]
+            humidity = humidity[order]
+            conditions = [conditions[i] for i in order]
+            descriptions = [descriptions[i] for i in order]
             
-            if date_str not in daily_data:
-                daily_data[date_str] = {
-                    'date': date_str,
-                    'temperatures': [],
-                    'conditions': [],
-                    'humidity': [],
-                    'descriptions': []
-                }
+            starts = np.flatnonzero(np.r_[True, day_idx[1:] != day_idx[:-1]])
+            ends = np.r_[starts[1:], count]
+            counts = ends - starts
+            
+            min_temps = np.minimum.reduceat(temperatures, starts)
+            max_temps = np.maximum.reduceat(temperatures, starts)
+            avg_temps = np.add.reduceat(temperatures, starts) / counts
+            avg_humidity = np.add.reduceat(humidity, starts) / counts
             
-            daily_data[date_str]['temperatures'].append(item['main']['temp'])
-            daily_data[date_str]['conditions'].append(item['weather'][0]['main'])
-            daily_data[date_str]['humidity'].append(item['main']['humidity'])
-            daily_data[date_str]['descriptions'].append(item['weather'][0]['description'])
-        
-        # Process daily summaries
-        for date_str, data in list(daily_data.items())[:days]:
-            forecasts.append({
-                'date': date_str,
-                'min_temp': round(min(data['temperatures']), 1),
-                'max_temp': round(max(data['temperatures']), 1),
-                'avg_temp': round(sum(data['temperatures']) / len(data['temperatures']), 1),
-                'condition': max(set(data['conditions']), key=data['conditions'].count),
-                'avg_humidity': round(sum(data['humidity']) / len(data['humidity']), 1),
-                'description': max(set(data['descriptions']), key=data['descriptions'].count)
-            })
+            # Process daily summaries; Counter finds each mode in one pass
+            for day, date_str in enumerate(list(dates)[:days]):
+                start, end = starts[day], ends[day]
+                forecasts.append({
+                    'date': date_str,
+                    'min_temp': round(float(min_temps[day]), 1),
+                    'max_temp': round(float(max_temps[day]), 1),
+                    'avg_temp': round(float(avg_temps[day]), 1),
+                    'condition': Counter(conditions[start:end]).most_common(1)[0][0],
+                    'avg_humidity': round(float(avg_humidity[day]), 1),
+                    'description': Counter(descriptions[start:end]).most_common(1)[0][0]
+                })
         
         return {
-            'location': api_data.get('city', {}).get('name', 'Unknown'),
+            'location': (api_data.get('city') or _EMPTY).get('name', 'Unknown'),
             'forecasts': forecasts,
-            'last_updated': datetime.now().isoformat()
+            'last_updated': now.isoformat()
         }
     
-    def _is_cached_valid(self, cache_key: str) -> bool:
-        """Check if cached data is still valid."""
+    def _get_cached(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the cache entry for a key if it is still valid, else None.
         
-        if cache_key not in self.cache:
-            return False
+        Learning Notes:
+        - Lookup and LRU bump happen under one lock and the caller keeps
+          the entry itself, so a concurrent eviction cannot make a later
+          read of the key fail
+        """
+        
+        with self._cache_lock:
+            entry = self.cache.get(cache_key)
+            if entry is None:
+                return None
+            
+            # Mark as recently used
+            self.cache.move_to_end(cache_key)
         
-        cached_time = self.cache[cache_key]['timestamp']
-        return datetime.now() - cached_time < self.cache_duration
+        # Monotonic float comparison: cheap and immune to clock changes
+        return entry if time.monotonic() < entry['expires'] else None
     
-    def _cache_data(self, cache_key: str, data: Dict[str, Any]) -> None:
-        """Cache data with timestamp."""
+    def _cache_data(self, cache_key: str, data: Dict[str, Any],
+                    response: Optional[Any] = None,
+                    timestamp: Optional[datetime] = None) -> None:
+        """Cache data with its expiry and the response's validators, if any."""
         
-        self.cache[cache_key] = {
-            'data': data,
-            'timestamp': datetime.now()
-        }
+        headers = response.headers if response is not None else {}
+        cached_at = timestamp.timestamp() if timestamp else time.time()
+        with self._cache_lock:
+            self.cache[cache_key] = {
+                'data': data,
+                'expires': time.monotonic() + self.cache_duration.total_seconds(),
+                'cached_at': cached_at,
+                'etag': headers.get('ETag'),
+                'last_modified': headers.get('Last-Modified')
+            }
+            self.cache.move_to_end(cache_key)
+            
+            # Evict least recently used entries beyond the bound
+            while len(self.cache) > self.cache_max_entries:
+                self.cache.popitem(last=False)
+        
+        self._persist_cache_entry(cache_key)
+    
+    def _open_disk_cache(self) -> None:
+        """
+        Open the SQLite cache file and load its recent entries into memory.
+        
+        Learning Notes:
+        - SQLite as a lightweight persistent key-value store
+        - Entries older than a day are pruned; stale-but-recent entries are
+          kept so they can still be revalidated with conditional GETs
+        """
+        
+        try:
+            self.cache_db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._disk_cache = sqlite3.connect(str(self.cache_db_path), check_same_thread=False)
+            
+            with self._disk_lock, self._disk_cache:
+                self._disk_cache.execute("""
+                    CREATE TABLE IF NOT EXISTS weather_cache (
+                        cache_key TEXT PRIMARY KEY,
+                        data TEXT NOT NULL,
+                        cached_at REAL NOT NULL,
+                        etag TEXT,
+                        last_modified TEXT
+                    )
+                """)
+                self._disk_cache.execute(
+                    "DELETE FROM weather_cache WHERE cached_at < ?",
+                    (time.time() - 24 * 60 * 60,)
+                )
+                rows = self._disk_cache.execute(
+                    "SELECT cache_key, data, cached_at, etag, last_modified "
+                    "FROM weather_cache ORDER BY cached_at DESC LIMIT ?",
+                    (self.cache_max_entries,)
+                ).fetchall()
+            
+            # Map wall-clock ages onto the monotonic clock used in memory
+            offset = time.monotonic() - time.time() + self.cache_duration.total_seconds()
+            
+            # Oldest first so the most recent entries end up most recently used
+            bad_keys = []
+            for cache_key, data, cached_at, etag, last_modified in reversed(rows):
+                try:
+                    decoded = self._decode_cached(cache_key, _loads(data))
+                except (TypeError, ValueError) as e:
+                    # One unreadable row only costs that entry, not the whole cache
+                    self.logger.warning(f"Dropping unreadable weather cache entry {cache_key}: {e}")
+                    bad_keys.append((cache_key,))
+                    continue
+                
+                self.cache[cache_key] = {
+                    'data': decoded,
+                    'expires': cached_at + offset,
+                    'cached_at': cached_at,
+                    'etag': etag,
+                    'last_modified': last_modified
+                }
+            
+            if bad_keys:
+                with self._disk_lock, self._disk_cache:
+                    self._disk_cache.executemany(
+                        "DELETE FROM weather_cache WHERE cache_key = ?", bad_keys)
+                
+        except (sqlite3.Error, OSError) as e:
+            self.logger.error(f"Weather disk cache unavailable: {e}")
+            if self._disk_cache is not None:
+                self._disk_cache.close()
+            self._disk_cache = None
+    
+    @staticmethod
+    def _encode_cached(data: Any) -> Any:
+        """Convert a cached result to JSON-ready data."""
+        return data.to_dict() if isinstance(data, CurrentWeather) else data
+    
+    @staticmethod
+    def _decode_cached(cache_key: str, data: Any) -> Any:
+        """Rebuild a cached result loaded from disk."""
+        return CurrentWeather(**data) if cache_key.startswith('current_') else data
+    
+    def _persist_cache_entry(self, cache_key: str) -> None:
+        """Write one in-memory cache entry through to the SQLite cache."""
+        
+        entry = self.cache.get(cache_key)
+        if self._disk_cache is None or entry is None:
+            return
+        
+        try:
+            with self._disk_lock, self._disk_cache:
+                self._disk_cache.execute(
+                    "INSERT OR REPLACE INTO weather_cache "
+                    "(cache_key, data, cached_at, etag, last_modified) VALUES (?, ?, ?, ?, ?)",
+                    (cache_key, json.dumps(self._encode_cached(entry['data'])), entry['cached_at'],
+                     entry['etag'], entry['last_modified'])
+                )
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            self.logger.error(f"Error saving weather cache entry {cache_key}: {e}")
+    
+    def _conditional_get(self, cache_key: str, url: str) -> Tuple[Any, Optional[Dict[str, Any]]]:
+        """
+        GET a URL, revalidating the stale cache entry for cache_key if there is one.
+        
+        Returns the response and, when the server answered 304, the cache
+        entry that was revalidated (None otherwise).
+        
+        Learning Notes:
+        - Conditional requests with If-None-Match / If-Modified-Since
+        - A 304 Not Modified reply has no body, so the cached copy is kept
+          and its lifetime extended instead of re-downloading and re-parsing
+        """
+        
+        headers = {}
+        with self._cache_lock:
+            entry = self.cache.get(cache_key)
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        
+        response = self.client.get(url, headers=headers, timeout=10)
+        
+        if response.status_code == 304 and entry:
+            entry['expires'] = time.monotonic() + self.cache_duration.total_seconds()
+            entry['cached_at'] = time.time()
+            self._persist_cache_entry(cache_key)
+            return response, entry
+        
+        response.raise_for_status()
+        return response, None
     
-    def _get_fallback_weather(self, location: str) -> Dict[str, Any]:
+    def _get_fallback_weather(self, location: str) -> CurrentWeather:
         """Return fallback weather data when API is unavailable."""
         
-        return {
-            'location': location,
-            'country': '',
-            'temperature': 20.0,
-            'feels_like': 20.0,
-            'humidity': 50,
-            'pressure': 1013,
-            'condition': 'Unknown',
-            'description': 'Weather data unavailable',
-            'icon': '01d',
-            'wind_speed': 0,
-            'wind_direction': 0,
-            'visibility': 10,
-            'uv_index': 0,
-            'last_updated': datetime.now().isoformat(),
-            'fallback': True
-        }
+        return CurrentWeather(location=location, last_updated=_now_iso(), **_FALLBACK_WEATHER)
     
     def _get_fallback_forecast(self, location: str, days: int) -> Dict[str, Any]:
         """Return fallback forecast data when API is unavailable."""
         
-        forecasts = []
         base_date = datetime.now()
-        
-        for i in range(days):
-            date = base_date + timedelta(days=i)
-            forecasts.append({
-                'date': date.strftime('%Y-%m-%d'),
-                'min_temp': 15.0,
-                'max_temp': 25.0,
-                'avg_temp': 20.0,
-                'condition': 'Unknown',
-                'avg_humidity': 50,
-                'description': 'Weather data unavailable'
-            })
+        forecasts = [
+            dict(_FALLBACK_FORECAST_DAY, date=(base_date + timedelta(days=i)).strftime('%Y-%m-%d'))
+            for i in range(days)
+        ]
         
         return {
             'location': location,
             'forecasts': forecasts,
-            'last_updated': datetime.now().isoformat(),
+            'last_updated': _now_iso(),
             'fallback': True
         }
     
+    def _get_fallback_air_quality(self) -> Dict[str, Any]:
+        """Return fallback air quality data when API is unavailable."""
+        
+        return dict(_FALLBACK_AIR_QUALITY, components={}, last_updated=_now_iso())
+    
     def search_locations(self, query: str) -> List[Dict[str, Any]]:
         """
         Search for locations by name.
@@ -339,18 +721,20 @@ class WeatherAPI:
         if not self.api_key:
             return [{'name': query, 'country': '', 'state': ''}]
         
+        return self._single_flight(f"search_{query}", lambda: self._fetch_locations(query))
+    
+    def _fetch_locations(self, query: str) -> List[Dict[str, Any]]:
+        """Query the geocoding API for locations matching a name."""
+        
         try:
-            url = f"http://api.openweathermap.org/geo/1.0/direct"
-            params = {
-                'q': query,
-                'limit': 5,
-                'appid': self.api_key
-            }
-            
-            response = requests.get(url, params=params, timeout=10)
+            url = self._geo_url_prefix.format(5) + quote(query, safe='')
+            response = self.client.get(url, timeout=10)
             response.raise_for_status()
             
-            locations = response.json()
+            locations = _loads(response.content)
+            
+            if locations:
+                self._remember_coords(query, locations[0]['lat'], locations[0]['lon'])
             
             return [
                 {
@@ -363,10 +747,31 @@ class WeatherAPI:
                 for loc in locations
             ]
             
-        except Exception as e:
-            self.logger.error(f"Location search failed: {e}")
+        except _HTTP_ERRORS as e:
+            self.logger.error(f"Location search request failed: {e}")
+            return [{'name': query, 'country': '', 'state': ''}]
+        except _PAYLOAD_ERRORS as e:
+            self.logger.error(f"Location search data processing failed: {e}")
             return [{'name': query, 'country': '', 'state': ''}]
     
+    def get_current_weather_many(self, locations: List[str]) -> Dict[str, CurrentWeather]:
+        """
+        Get current weather for several locations concurrently.
+        
+        Learning Notes:
+        - Thread pools overlap blocking network waits
+        - The pooled client reuses connections across threads
+        """
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            return dict(zip(locations, executor.map(self.get_current_weather, locations)))
+    
+    def search_locations_many(self, queries: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """Search for several location names concurrently."""
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            return dict(zip(queries, executor.map(self.search_locations, queries)))
+    
     def get_air_quality(self, location: Optional[str] = None) -> Dict[str, Any]:
         """
         Get air quality data for a location.
@@ -382,37 +787,284 @@ class WeatherAPI:
         if not self.api_key:
             return {'aqi': 3, 'description': 'Moderate', 'components': {}}
         
+        return self._single_flight(f"air_quality_{location}", lambda: self._fetch_air_quality(location))
+    
+    def _fetch_air_quality(self, location: str) -> Dict[str, Any]:
+        """Geocode a location and fetch its current air quality."""
+        
         try:
-            # First get coordinates for the location
-            geo_url = f"http://api.openweathermap.org/geo/1.0/direct"
-            geo_params = {
-                'q': location,
-                'limit': 1,
-                'appid': self.api_key
+            lat, lon = self._geocode(location)
+            
+            # Get air quality data
+            aq_url = f"{self._air_quality_url_prefix}&lat={lat}&lon={lon}"
+            aq_response = self.client.get(aq_url, timeout=10)
+            aq_response.raise_for_status()
+            aq_data = _loads(aq_response.content)
+            
+            # Transform air quality data
+            aqi_levels = ['Good', 'Fair', 'Moderate', 'Poor', 'Very Poor']
+            current_aq = aq_data['list'][0]
+            
+            return {
+                'aqi': current_aq['main']['aqi'],
+                'description': aqi_levels[current_aq['main']['aqi'] - 1],
+                'components': current_aq['components'],
+                'last_updated': datetime.now().isoformat()
             }
             
-            geo_response = requests.get(geo_url, params=geo_params, timeout=10)
-            geo_response.raise_for_status()
-            geo_data = geo_response.json()
+        except _HTTP_ERRORS as e:
+            self.logger.error(f"Air quality request failed: {e}")
+            return self._get_fallback_air_quality()
+        except _PAYLOAD_ERRORS as e:
+            self.logger.error(f"Air quality data processing failed: {e}")
+            return self._get_fallback_air_quality()
+    
+    def _geocode(self, location: str) -> tuple:
+        """
+        Resolve a location name to (lat, lon), reusing recent lookups.
+        
+        Learning Notes:
+        - Memoizing slow-changing lookups saves a full network round-trip
+        """
+        
+        coords = self._cached_coords(location)
+        if coords:
+            return coords
+        
+        url = self._geo_url_prefix.format(1) + quote(location, safe='')
+        response = self.client.get(url, timeout=10)
+        response.raise_for_status()
+        geo_data = _loads(response.content)
+        
+        if not geo_data:
+            raise LookupError("Location not found")
+        
+        return self._remember_coords(location, geo_data[0]['lat'], geo_data[0]['lon'])
+    
+    def _cached_coords(self, location: str) -> Optional[tuple]:
+        """Return unexpired cached coordinates for a location, if any."""
+        
+        entry = self._geocode_cache.get(location.strip().lower())
+        if entry and datetime.now() < entry[2]:
+            return entry[0], entry[1]
+        return None
+    
+    def _remember_coords(self, location: str, lat: float, lon: float) -> tuple:
+        """Cache the coordinates resolved for a location name."""
+        
+        self._geocode_cache[location.strip().lower()] = (lat, lon, datetime.now() + self.geocode_duration)
+        return lat, lon
+    
+    def _single_flight(self, key: str, fetch: Callable[[], Any]) -> Any:
+        """
+        Run fetch() once per key at a time; concurrent callers share its result.
+        
+        Learning Notes:
+        - Request coalescing: the first caller does the work, the others
+          wait on a Future instead of issuing duplicate HTTP requests
+        """
+        
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._inflight[key] = future
+        
+        if not is_leader:
+            return future.result()
+        
+        try:
+            result = fetch()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+class AsyncWeatherAPI(WeatherAPI):
+    """
+    Asynchronous weather API client built on aiohttp.
+    
+    Learning Notes:
+    - async/await for network-bound work
+    - Sharing one pooled ClientSession across requests
+    - Fanning out many requests with asyncio.gather
+    
+    Shares caching, transforms and fallbacks with WeatherAPI, which stays
+    the synchronous facade for existing callers.
+    """
+    
+    def __init__(self, config: Config):
+        """Initialize async weather API; the HTTP session is created on first use."""
+        
+        super().__init__(config)
+        self._session = None
+    
+    async def _get_session(self):
+        """Return the pooled aiohttp session, creating it inside the running loop."""
+        
+        if aiohttp is None:
+            raise RuntimeError("aiohttp is required for AsyncWeatherAPI")
+        
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=32, ttl_dns_cache=300, keepalive_timeout=60)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers={'Accept-Encoding': _ACCEPT_ENCODING},
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+        return self._session
+    
+    async def close(self) -> None:
+        """Close the underlying HTTP session."""
+        
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    def get_current_weather_many(self, locations: List[str]) -> Dict[str, CurrentWeather]:
+        """Not available here: get_current_weather is a coroutine on this class."""
+        raise TypeError("AsyncWeatherAPI is asynchronous; await get_many_current() "
+                        "or call get_many_current_sync() instead")
+    
+    def search_locations_many(self, queries: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """Not available here: search_locations is a coroutine on this class."""
+        raise TypeError("AsyncWeatherAPI is asynchronous; gather search_locations() "
+                        "calls instead")
+    
+    async def _get_json(self, url: str) -> Any:
+        """GET a prebuilt URL and decode its JSON body."""
+        
+        session = await self._get_session()
+        async with session.get(url) as response:
+            response.raise_for_status()
+            return _loads(await response.read())
+    
+    async def get_current_weather(self, location: Optional[str] = None) -> CurrentWeather:
+        """Get current weather data for a location without blocking the event loop."""
+        
+        location = location or self.default_location
+        
+        cache_key = f"current_{location}"
+        entry = self._get_cached(cache_key)
+        if entry is not None:
+            return entry['data']
+        
+        if not self.api_key:
+            return self._get_fallback_weather(location)
+        
+        try:
+            data = await self._get_json(self._current_url_prefix + quote(location, safe=''))
             
-            if not geo_data:
-                raise Exception("Location not found")
+            now = datetime.now()
+            weather_data = self._transform_current_weather(data, now)
+            self._cache_data(cache_key, weather_data, timestamp=now)
             
-            lat, lon = geo_data[0]['lat'], geo_data[0]['lon']
+            self.logger.info(f"Weather data fetched for {location}")
+            return weather_data
             
-            # Get air quality data
-            aq_url = f"{self.base_url}/air_pollution"
-            aq_params = {
-                'lat': lat,
-                'lon': lon,
-                'appid': self.api_key
-            }
+        except _ASYNC_HTTP_ERRORS as e:
+            self.logger.error(f"Weather API request failed: {e}")
+            return self._get_fallback_weather(location)
+        except _PAYLOAD_ERRORS as e:
+            self.logger.error(f"Weather data processing failed: {e}")
+            return self._get_fallback_weather(location)
+    
+    async def get_forecast(self, location: Optional[str] = None, days: int = 5) -> Dict[str, Any]:
+        """Get weather forecast for multiple days without blocking the event loop."""
+        
+        location = location or self.default_location
+        
+        cache_key = f"forecast_{location}_{days}"
+        entry = self._get_cached(cache_key)
+        if entry is not None:
+            return entry['data']
+        
+        if not self.api_key:
+            return self._get_fallback_forecast(location, days)
+        
+        try:
+            url = self._forecast_url_prefix.format(days * 8) + quote(location, safe='')
+            data = await self._get_json(url)
             
-            aq_response = requests.get(aq_url, params=aq_params, timeout=10)
-            aq_response.raise_for_status()
-            aq_data = aq_response.json()
+            now = datetime.now()
+            forecast_data = self._transform_forecast(data, days, now)
+            self._cache_data(cache_key, forecast_data, timestamp=now)
+            
+            return forecast_data
+            
+        except _ASYNC_HTTP_ERRORS as e:
+            self.logger.error(f"Forecast API request failed: {e}")
+            return self._get_fallback_forecast(location, days)
+        except _PAYLOAD_ERRORS as e:
+            self.logger.error(f"Forecast data processing failed: {e}")
+            return self._get_fallback_forecast(location, days)
+    
+    async def search_locations(self, query: str) -> List[Dict[str, Any]]:
+        """Search for locations by name without blocking the event loop."""
+        
+        if not self.api_key:
+            return [{'name': query, 'country': '', 'state': ''}]
+        
+        try:
+            locations = await self._get_json(self._geo_url_prefix.format(5) + quote(query, safe=''))
+            
+            if locations:
+                self._remember_coords(query, locations[0]['lat'], locations[0]['lon'])
+            
+            return [
+                {
+                    'name': loc.get('name', ''),
+                    'country': loc.get('country', ''),
+                    'state': loc.get('state', ''),
+                    'lat': loc.get('lat', 0),
+                    'lon': loc.get('lon', 0)
+                }
+                for loc in locations
+            ]
+            
+        except _ASYNC_HTTP_ERRORS as e:
+            self.logger.error(f"Location search request failed: {e}")
+            return [{'name': query, 'country': '', 'state': ''}]
+        except _PAYLOAD_ERRORS as e:
+            self.logger.error(f"Location search data processing failed: {e}")
+            return [{'name': query, 'country': '', 'state': ''}]
+    
+    async def get_air_quality(self, location: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get air quality data for a location without blocking the event loop.
+        
+        The air pollution request needs the geocoded coordinates, so the two
+        requests stay in sequence unless the coordinates are already cached.
+        """
+        
+        location = location or self.default_location
+        
+        if not self.api_key:
+            return {'aqi': 3, 'description': 'Moderate', 'components': {}}
+        
+        try:
+            coords = self._cached_coords(location)
+            if coords is None:
+                geo_data = await self._get_json(self._geo_url_prefix.format(1) + quote(location, safe=''))
+                
+                if not geo_data:
+                    raise LookupError("Location not found")
+                
+                coords = self._remember_coords(location, geo_data[0]['lat'], geo_data[0]['lon'])
+            
+            aq_data = await self._get_json(f"{self._air_quality_url_prefix}&lat={coords[0]}&lon={coords[1]}")
             
-            # Transform air quality data
             aqi_levels = ['Good', 'Fair', 'Moderate', 'Poor', 'Very Poor']
             current_aq = aq_data['list'][0]
             
@@ -423,12 +1075,32 @@ class WeatherAPI:
                 'last_updated': datetime.now().isoformat()
             }
             
-        except Exception as e:
+        except _ASYNC_HTTP_ERRORS as e:
             self.logger.error(f"Air quality request failed: {e}")
-            return {
-                'aqi': 3,
-                'description': 'Moderate',
-                'components': {},
-                'last_updated': datetime.now().isoformat(),
-                'fallback': True
-            } 
\ No newline at end of file
+            return self._get_fallback_air_quality()
+        except _PAYLOAD_ERRORS as e:
+            self.logger.error(f"Air quality data processing failed: {e}")
+            return self._get_fallback_air_quality()
+    
+    async def get_many_current(self, locations: List[str]) -> Dict[str, CurrentWeather]:
+        """
+        Get current weather for several locations concurrently.
+        
+        Learning Notes:
+        - asyncio.gather overlaps the network waits of all requests
+        - N locations cost roughly one round-trip instead of N
+        """
+        
+        results = await asyncio.gather(*(self.get_current_weather(loc) for loc in locations))
+        return dict(zip(locations, results))
+    
+    def get_many_current_sync(self, locations: List[str]) -> Dict[str, CurrentWeather]:
+        """Synchronous wrapper around get_many_current for code outside an event loop."""
+        
+        async def run():
+            try:
+                return await self.get_many_current(locations)
+            finally:
+                await self.close()
+        
+        return asyncio.run(run())
@@ -0,0 +1,25 @@
+"""
+Shared pytest fixtures for the CodeMaster Pro test suite.
+
+Every test gets its own home directory, so configuration, font caches and
+the weather cache database never touch the real ~/.codemaster_pro.
+"""
+
+import pytest
+
+from utils.config import Config
+
+# test_app.py is the interactive system check, not a pytest module
+collect_ignore = ["test_app.py"]
+
+_API_KEY_VARS = ('OPENAI_API_KEY', 'ANTHROPIC_API_KEY', 'WEATHER_API_KEY', 'GOOGLE_FONTS_API_KEY')
+
+@pytest.fixture
+def config(tmp_path, monkeypatch):
+    """A fresh Config rooted in a temporary home, with no API keys set."""
+    
+    monkeypatch.setenv('HOME', str(tmp_path))
+    for var in _API_KEY_VARS:
+        monkeypatch.delenv(var, raising=False)
+    monkeypatch.setattr(Config, '_instance', None)
+    return Config()
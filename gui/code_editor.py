@@ -12,10 +12,194 @@ import customtkinter as ctk
 import tkinter as tk
 from tkinter import filedialog, messagebox
 import os
+import re
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from utils.config import Config
 
+# Line classifiers for the code analysis report; anchored at line starts so
+# "# def foo" or "default = 1" are not counted as definitions
+_DEF_RE = re.compile(r'^[ \t]*(?:async[ \t]+)?def\s', re.MULTILINE)
+_CLASS_RE = re.compile(r'^[ \t]*class\s', re.MULTILINE)
+_COMMENT_RE = re.compile(r'^[ \t]*#', re.MULTILINE)
+_NON_EMPTY_RE = re.compile(r'^[^\S\n]*\S', re.MULTILINE)
+
+# Editor lines copied into Python per call while analyzing code
+_ANALYSIS_CHUNK_LINES = 5000
+
+# Files longer than this many characters are inserted into the editor
+# piecewise, with redraws in between
+_INSERT_CHUNK_SIZE = 64 * 1024
+
+# Height of one file list row in canvas pixels
+_FILE_ROW_HEIGHT = 26
+
+# (title, message) for the AI features that still need an API key
+_AI_MESSAGES = {
+    'docs': (
+        "AI Documentation",
+        "Documentation generation requires AI API key setup.\n\n"
+        "This feature will:\n"
+        "• Generate docstrings for functions\n"
+        "• Create README files\n"
+        "• Document API endpoints\n"
+        "• Explain complex algorithms\n\n"
+        "Add your OpenAI/Anthropic API key to enable this feature."
+    ),
+    'refactor': (
+        "AI Refactoring",
+        "Code refactoring suggestions require AI API key setup.\n\n"
+        "This feature will:\n"
+        "• Suggest code optimizations\n"
+        "• Identify code smells\n"
+        "• Recommend design patterns\n"
+        "• Improve code structure\n\n"
+        "Add your OpenAI/Anthropic API key to enable this feature."
+    ),
+    'explain': (
+        "AI Code Explanation",
+        "Code explanation requires AI API key setup.\n\n"
+        "This feature will:\n"
+        "• Explain complex algorithms\n"
+        "• Describe function purposes\n"
+        "• Clarify code logic\n"
+        "• Provide learning insights\n\n"
+        "Add your OpenAI/Anthropic API key to enable this feature."
+    )
+}
+
+# Disk reads and writes run here so large files never block the Tk main loop
+_io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="editor-io")
+
+# Saves run one at a time and in order, so an older buffer never lands last
+_save_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="editor-save")
+
+# Mode open() would give a new file; os.umask can only be read by setting it
+_UMASK = os.umask(0o022)
+os.umask(_UMASK)
+_NEW_FILE_MODE = 0o666 & ~_UMASK
+
+# Hover prefetches in flight at once, so they never crowd out real opens
+_prefetch_slots = threading.BoundedSemaphore(2)
+
+def _code_line_stats(code: str) -> Tuple[int, int, int, int]:
+    """Count non-empty, comment, function and class lines in a block of whole lines."""
+    # Every statistic is a compiled pattern over the whole text; no per-line strings are built
+    non_empty = len(_NON_EMPTY_RE.findall(code))
+    comments = len(_COMMENT_RE.findall(code))
+    functions = len(_DEF_RE.findall(code))
+    classes = len(_CLASS_RE.findall(code))
+    
+    return non_empty, comments, functions, classes
+
+def _sum_line_stats(chunks: List[str]) -> Tuple[int, int, int, int]:
+    """Add up _code_line_stats over line-aligned chunks (runs on the I/O pool)."""
+    totals = [0, 0, 0, 0]
+    for chunk in chunks:
+        for i, count in enumerate(_code_line_stats(chunk)):
+            totals[i] += count
+    return tuple(totals)
+
+def _appearance_color(color) -> str:
+    """Resolve a customtkinter (light, dark) color pair for a plain Tk widget."""
+    if isinstance(color, (list, tuple)):
+        return color[1] if ctk.get_appearance_mode() == "Dark" else color[0]
+    return color
+
+def _sniff_encoding(raw: bytes) -> str:
+    """Pick a codec from the byte order mark, defaulting to UTF-8."""
+    if raw[:3] == b'\xef\xbb\xbf':
+        return 'utf-8-sig'
+    if raw[:2] in (b'\xff\xfe', b'\xfe\xff'):
+        return 'utf-16'
+    return 'utf-8'
+
+def _read_text(file_path: str) -> Tuple[str, str, bool]:
+    """
+    Read a whole text file in one go (runs on the I/O pool).
+    
+    Returns (content, encoding, lossy); lossy means some bytes were not valid
+    in the encoding and were replaced with U+FFFD.
+    """
+    # Binary read plus one decode skips the TextIOWrapper and its incremental decoder
+    raw = Path(file_path).read_bytes()
+    encoding = _sniff_encoding(raw)
+    try:
+        content, lossy = raw.decode(encoding), False
+    except UnicodeDecodeError:
+        content, lossy = raw.decode(encoding, errors='replace'), True
+    return content.replace('\r\n', '\n'), encoding, lossy
+
+@lru_cache(maxsize=32)
+def _read_cached(file_path: str, mtime_ns: int) -> Tuple[str, str, bool]:
+    """Read a file once per modification time; edits on disk change the key."""
+    return _read_text(file_path)
+
+def _read_file(file_path: str) -> Tuple[str, str, bool]:
+    """Read a file, from memory if it is unchanged since the last read (runs on the I/O pool)."""
+    return _read_cached(file_path, os.stat(file_path).st_mtime_ns)
+
+def _write_file(file_path: str, content: str, encoding: str) -> None:
+    """Replace a file's contents atomically (runs on the save pool)."""
+    target = Path(file_path)
+    
+    # Write a temporary file beside the target and swap it in, so a failed
+    # or interrupted save never leaves half a file behind
+    with tempfile.NamedTemporaryFile(dir=target.parent, prefix=target.name,
+                                     suffix='.tmp', delete=False) as raw:
+        tmp_file = raw.name
+    try:
+        with open(tmp_file, 'w', encoding=encoding) as f:
+            f.write(content)
+        # Keep the permissions of the file being replaced (temporary files are private)
+        try:
+            mode = os.stat(target).st_mode & 0o7777
+        except FileNotFoundError:
+            mode = _NEW_FILE_MODE
+        os.chmod(tmp_file, mode)
+        os.replace(tmp_file, target)
+    except BaseException:
+        Path(tmp_file).unlink(missing_ok=True)
+        raise
+
+def _prefetch_file(file_path: str) -> None:
+    """Warm the read cache for a file under the pointer (runs on the I/O pool)."""
+    try:
+        _read_file(file_path)
+    except OSError:
+        pass  # Opening it for real will report the problem
+    finally:
+        _prefetch_slots.release()
+
+def _scan_python_files(project_dir: str) -> List[str]:
+    """
+    List .py files under a directory (runs on the I/O pool).
+    
+    os.scandir hands back each entry's type from the directory listing, so
+    unlike Path.glob no extra stat call is needed per entry.
+    """
+    found = []
+    pending = [project_dir]
+    while pending:
+        directory = pending.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            if directory == project_dir:
+                raise  # The project directory itself is unreadable
+            continue  # Skip unreadable subdirectories, as glob does
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.name.endswith('.py') and entry.is_file():
+                    found.append(entry.path)
+    return found
+
 class CodeEditorWidget:
     """
     Code editor with syntax highlighting and AI features.
@@ -29,6 +213,25 @@ class CodeEditorWidget:
     6. Code analysis features
     """
     
+    # Fonts shared by every editor widget, by role; created on first use
+    # because a CTkFont needs the Tk root window to exist
+    _font_cache: Optional[Dict[str, ctk.CTkFont]] = None
+    
+    @classmethod
+    def _fonts(cls, config: Config) -> Dict[str, ctk.CTkFont]:
+        """Create the shared fonts once and return them."""
+        if cls._font_cache is None:
+            cls._font_cache = {
+                'title': ctk.CTkFont(size=16, weight="bold"),
+                'heading': ctk.CTkFont(size=14, weight="bold"),
+                'label_bold': ctk.CTkFont(size=12, weight="bold"),
+                'label': ctk.CTkFont(size=12),
+                'small': ctk.CTkFont(size=10),
+                'code': ctk.CTkFont(family=config.get('preferred_font_family', 'Consolas'),
+                                    size=config.get('font_size', 12))
+            }
+        return cls._font_cache
+    
     def __init__(self, parent: ctk.CTkFrame, config: Config):
         """Initialize the code editor widget."""
         
@@ -37,8 +240,19 @@ class CodeEditorWidget:
         
         # Editor state
         self.current_file = None
-        self.open_files = {}  # file_path: content
-        self.modified_files = set()
+        self._file_encoding = 'utf-8'  # Codec the current file was read with, reused on save
+        self._lossy_decode = False  # Undecodable bytes were replaced; saving would lose them
+        self._pending_load: Optional[Future] = None  # Newest file read in flight
+        self._pending_scan: Optional[Future] = None  # Newest project scan in flight
+        self._is_modified = False  # Mirrors the "● Modified" label without asking Tk
+        self._dirty_pending = False  # A modified check is already queued for idle time
+        self._streaming: Optional[str] = None  # Large file still being inserted
+        
+        # Project file list: every (path, label) pair; the canvas draws only
+        # the rows in view (see _render_file_rows)
+        self.project_files: List[Tuple[str, str]] = []
+        self._rendered_rows: Optional[Tuple[int, int, int]] = None  # (first, end, total) drawn
+        self._hover_index: Optional[int] = None
         
         # Create the interface
         self.setup_layout()
@@ -76,11 +290,13 @@ class CodeEditorWidget:
     def setup_toolbar(self) -> None:
         """Set up the toolbar with file operations."""
         
+        fonts = self._fonts(self.config)
+        
         # Title
         title_label = ctk.CTkLabel(
             self.toolbar_frame,
             text="💻 Code Editor & AI Assistant",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=fonts['title']
         )
         title_label.pack(side="left", padx=15, pady=12)
         
@@ -126,6 +342,8 @@ class CodeEditorWidget:
     def setup_editor(self) -> None:
         """Set up the main code editor area."""
         
+        fonts = self._fonts(self.config)
+        
         # File tabs (will be implemented for multiple files)
         self.tabs_frame = ctk.CTkFrame(self.editor_frame, height=40)
         self.tabs_frame.grid(row=0, column=0, sticky="ew", padx=5, pady=(5, 0))
@@ -134,7 +352,7 @@ class CodeEditorWidget:
         self.current_file_label = ctk.CTkLabel(
             self.tabs_frame,
             text="📄 untitled.py",
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=fonts['label_bold']
         )
         self.current_file_label.pack(side="left", padx=15, pady=10)
         
@@ -142,15 +360,14 @@ class CodeEditorWidget:
         self.modified_label = ctk.CTkLabel(
             self.tabs_frame,
             text="",
-            font=ctk.CTkFont(size=12)
+            font=fonts['label']
         )
         self.modified_label.pack(side="left", padx=5)
         
         # Editor text widget
         self.code_editor = ctk.CTkTextbox(
             self.editor_frame,
-            font=ctk.CTkFont(family=self.config.get('preferred_font_family', 'Consolas'), 
-                           size=self.config.get('font_size', 12))
+            font=fonts['code']
         )
         self.code_editor.grid(row=1, column=0, sticky="nsew", padx=5, pady=5)
         
@@ -184,11 +401,13 @@ if __name__ == "__main__":
     def setup_file_explorer(self) -> None:
         """Set up the file explorer panel."""
         
+        fonts = self._fonts(self.config)
+        
         # Explorer title
         explorer_title = ctk.CTkLabel(
             self.explorer_frame,
             text="📁 File Explorer",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=fonts['heading']
         )
         explorer_title.pack(pady=(15, 10))
         
@@ -196,7 +415,7 @@ if __name__ == "__main__":
         self.current_dir_label = ctk.CTkLabel(
             self.explorer_frame,
             text="No project loaded",
-            font=ctk.CTkFont(size=10),
+            font=fonts['small'],
             wraplength=200
         )
         self.current_dir_label.pack(pady=5)
@@ -210,15 +429,36 @@ if __name__ == "__main__":
         )
         self.load_project_btn.pack(pady=10)
         
-        # File list
-        self.file_list_frame = ctk.CTkScrollableFrame(self.explorer_frame, height=300)
+        # File list: a canvas that draws file names for the visible rows only
+        self.file_list_frame = ctk.CTkFrame(self.explorer_frame, height=300)
         self.file_list_frame.pack(fill="both", expand=True, padx=10, pady=10)
+        self.file_list_frame.grid_rowconfigure(0, weight=1)
+        self.file_list_frame.grid_columnconfigure(0, weight=1)
+        
+        self.file_list_canvas = tk.Canvas(
+            self.file_list_frame,
+            height=300,
+            highlightthickness=0,
+            bg=_appearance_color(self.file_list_frame.cget("fg_color")),
+            yscrollincrement=_FILE_ROW_HEIGHT,  # One scroll unit is one row
+            yscrollcommand=self._on_file_list_yview
+        )
+        self.file_list_canvas.grid(row=0, column=0, sticky="nsew", padx=(5, 0), pady=5)
+        self.file_list_canvas.bind("<Configure>", self._on_file_list_resize)
+        self.file_list_canvas.bind("<Button-1>", self._on_file_list_click)
+        self.file_list_canvas.bind("<Motion>", self._on_file_list_motion)
+        self.file_list_canvas.bind("<Leave>", self._clear_file_list_hover)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.file_list_canvas.bind(sequence, self._on_file_list_wheel)
+        
+        self.file_list_scrollbar = ctk.CTkScrollbar(self.file_list_frame, command=self.file_list_canvas.yview)
+        self.file_list_scrollbar.grid(row=0, column=1, sticky="ns")
         
         # Recent files section
         recent_title = ctk.CTkLabel(
             self.explorer_frame,
             text="📋 Recent Files",
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=fonts['label_bold']
         )
         recent_title.pack(pady=(10, 5))
         
@@ -230,43 +470,39 @@ if __name__ == "__main__":
         ai_title = ctk.CTkLabel(
             self.explorer_frame,
             text="🤖 AI Features",
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=fonts['label_bold']
         )
         ai_title.pack(pady=(10, 5))
         
-        # AI buttons
-        self.doc_gen_btn = ctk.CTkButton(
-            self.explorer_frame,
-            text="📝 Generate Docs",
-            width=180,
-            command=self.generate_documentation
+        # AI buttons: one shared configuration, one entry per feature
+        ai_button_config = dict(width=180)
+        ai_features = (
+            ("📝 Generate Docs", self.generate_documentation),
+            ("🔧 Suggest Refactor", self.suggest_refactoring),
+            ("💡 Explain Code", self.explain_code)
         )
-        self.doc_gen_btn.pack(pady=2)
         
-        self.refactor_btn = ctk.CTkButton(
-            self.explorer_frame,
-            text="🔧 Suggest Refactor",
-            width=180,
-            command=self.suggest_refactoring
-        )
-        self.refactor_btn.pack(pady=2)
+        ai_buttons = []
+        for text, command in ai_features:
+            button = ctk.CTkButton(self.explorer_frame, text=text, command=command, **ai_button_config)
+            button.pack(pady=2)
+            ai_buttons.append(button)
         
-        self.explain_btn = ctk.CTkButton(
-            self.explorer_frame,
-            text="💡 Explain Code",
-            width=180,
-            command=self.explain_code
-        )
-        self.explain_btn.pack(pady=2)
+        self.doc_gen_btn, self.refactor_btn, self.explain_btn = ai_buttons
     
     def new_file(self) -> None:
         """Create a new file."""
         
-        # Clear editor
+        # Clear editor; a file read still in flight must not replace the new buffer
+        self._pending_load = None
+        self._stop_streaming()
         self.code_editor.delete("1.0", "end")
         self.current_file = None
+        self._file_encoding = 'utf-8'
+        self._lossy_decode = False
         self.current_file_label.configure(text="📄 untitled.py")
         self.modified_label.configure(text="")
+        self._is_modified = False
         
         # Add template based on file type
         template = '''# New Python file
@@ -297,22 +533,107 @@ if __name__ == "__main__":
         )
         
         if file_path:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                self.code_editor.delete("1.0", "end")
-                self.code_editor.insert("1.0", content)
-                
-                self.current_file = file_path
-                self.current_file_label.configure(text=f"📄 {Path(file_path).name}")
-                self.modified_label.configure(text="")
-                
-                # Add to recent files
-                self.add_to_recent_files(file_path)
-                
-            except Exception as e:
-                messagebox.showerror("Error", f"Could not open file: {e}")
+            self._load_file(file_path, add_to_recent=True)
+    
+    def _load_file(self, file_path: str, add_to_recent: bool = False) -> None:
+        """
+        Read a file on the I/O pool and show it in the editor when done.
+        
+        Learning Notes:
+        - The disk read happens on a worker thread, so the window keeps
+          repainting while a large file loads
+        - Recently opened files come from an LRU cache keyed by path and
+          modification time, so switching back and forth skips the disk
+        - Tk widgets may only be touched from the main thread, so the
+          result is handed back with after(0, ...)
+        """
+        
+        future = _io_pool.submit(_read_file, file_path)
+        self._pending_load = future
+        future.add_done_callback(
+            lambda f: self.parent.after(0, self._apply_loaded_content, file_path, f, add_to_recent)
+        )
+    
+    def _apply_loaded_content(self, file_path: str, future: Future, add_to_recent: bool) -> None:
+        """Put a finished file read into the editor (main thread)."""
+        
+        # A newer open superseded this one
+        if future is not self._pending_load:
+            return
+        self._pending_load = None
+        
+        try:
+            content, encoding, lossy = future.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not open file: {e}")
+            return
+        
+        self._stop_streaming()
+        self.code_editor.delete("1.0", "end")
+        
+        self.current_file = file_path
+        self._file_encoding = encoding
+        self._lossy_decode = lossy
+        self.current_file_label.configure(text=f"📄 {Path(file_path).name}")
+        self.modified_label.configure(text="")
+        self._is_modified = False
+        
+        if len(content) <= _INSERT_CHUNK_SIZE:
+            self.code_editor.insert("1.0", content)
+        else:
+            # Saving or analyzing a half-inserted file would see only part
+            # of it, and keystrokes would land among the pieces, so the
+            # editor is read-only until the last piece is in
+            self._streaming = content
+            self.save_btn.configure(state="disabled")
+            self.analyze_btn.configure(state="disabled")
+            self.code_editor.configure(state="disabled")
+            self.parent.after_idle(self._insert_chunk, content, 0)
+        
+        if add_to_recent:
+            self.add_to_recent_files(file_path)
+        
+        if lossy:
+            messagebox.showwarning(
+                "Encoding Warning",
+                f"{Path(file_path).name} is not valid {encoding}; the bytes that could "
+                "not be decoded are shown as \ufffd.\n\n"
+                "Saving this file would replace them permanently."
+            )
+    
+    def _insert_chunk(self, content: str, offset: int) -> None:
+        """
+        Append the next piece of a large file, then yield to Tk until idle again.
+        
+        Learning Notes:
+        - One huge insert stalls the text widget for seconds; 64 KB pieces
+          interleaved with redraws keep the window responsive
+        - The label shows how far the load has got
+        """
+        
+        # A newer open or a new file superseded this load
+        if content is not self._streaming:
+            return
+        
+        end = offset + _INSERT_CHUNK_SIZE
+        self.code_editor.configure(state="normal")
+        self.code_editor.insert("end-1c", content[offset:end])
+        self.code_editor.configure(state="disabled")
+        
+        if end < len(content):
+            self.modified_label.configure(text=f"⏳ Loading {end * 100 // len(content)}%")
+            self.parent.after_idle(self._insert_chunk, content, end)
+        else:
+            self._stop_streaming()
+            self.modified_label.configure(text="")
+    
+    def _stop_streaming(self) -> None:
+        """Abandon any chunked insert in progress and make the editor usable again."""
+        if self._streaming is not None:
+            self._streaming = None
+            self.code_editor.configure(state="normal")
+            self.save_btn.configure(state="normal")
+            self.analyze_btn.configure(state="normal")
     
     def save_file(self) -> None:
         """Save the current file."""
@@ -338,19 +659,52 @@ if __name__ == "__main__":
             self.current_file = file_path
             self.current_file_label.configure(text=f"📄 {Path(file_path).name}")
         
+        # Writing a lossy decode back destroys the original bytes, so ask first
+        if self._lossy_decode:
+            if not messagebox.askyesno(
+                "Encoding Warning",
+                f"{Path(self.current_file).name} had bytes that could not be decoded.\n\n"
+                f"Save it as {self._file_encoding} anyway, replacing them permanently?"
+            ):
+                return
+            self._lossy_decode = False
+        
+        # Snapshot the text on the main thread, write it on the save pool
+        # with the encoding the file was read in (BOM included)
+        file_path = self.current_file
+        content = self.code_editor.get("1.0", "end-1c")
+        future = _save_pool.submit(_write_file, file_path, content, self._file_encoding)
+        future.add_done_callback(
+            lambda f: self.parent.after(0, self._on_file_saved, file_path, content, f)
+        )
+    
+    def _on_file_saved(self, file_path: str, content: str, future: Future) -> None:
+        """Report the result of a background save (main thread)."""
+        
         try:
-            content = self.code_editor.get("1.0", "end-1c")
-            
-            with open(self.current_file, 'w', encoding='utf-8') as f:
-                f.write(content)
-            
-            self.modified_label.configure(text="✅ Saved")
-            
-            # Clear modified indicator after 2 seconds
-            self.parent.after(2000, lambda: self.modified_label.configure(text=""))
-            
+            future.result()
         except Exception as e:
             messagebox.showerror("Error", f"Could not save file: {e}")
+            return
+        
+        # Edits made after the snapshot are still unsaved
+        if file_path != self.current_file:
+            return
+        if self.code_editor.get("1.0", "end-1c") != content:
+            self._is_modified = True
+            self.modified_label.configure(text="● Modified")
+            return
+        
+        self._is_modified = False
+        self.modified_label.configure(text="✅ Saved")
+        
+        # Clear modified indicator after 2 seconds
+        self.parent.after(2000, self._clear_saved_indicator)
+    
+    def _clear_saved_indicator(self) -> None:
+        """Remove the saved notice unless the file was edited again meanwhile."""
+        if not self._is_modified:
+            self.modified_label.configure(text="")
     
     def load_project(self) -> None:
         """Load a project directory."""
@@ -365,59 +719,188 @@ if __name__ == "__main__":
         """Load files from project directory."""
         
         # Clear existing file list
-        for widget in self.file_list_frame.winfo_children():
-            widget.destroy()
+        self.project_files = []
+        self.file_list_canvas.yview_moveto(0)
+        self._render_file_rows()
+        
+        # Walk the tree on the I/O pool; the list is filled back on the main thread
+        future = _io_pool.submit(_scan_python_files, project_dir)
+        self._pending_scan = future
+        future.add_done_callback(
+            lambda f: self.parent.after(0, self._populate_file_list, project_dir, f)
+        )
+    
+    def _populate_file_list(self, project_dir: str, future: Future) -> None:
+        """Show the scanned files in the file list (main thread)."""
+        
+        # A newer project load superseded this one
+        if future is not self._pending_scan:
+            return
+        self._pending_scan = None
         
         try:
-            project_path = Path(project_dir)
-            
-            # Get Python files in the project
-            python_files = list(project_path.glob("**/*.py"))
-            
-            for file_path in python_files[:20]:  # Limit to 20 files
-                relative_path = file_path.relative_to(project_path)
-                
-                file_btn = ctk.CTkButton(
-                    self.file_list_frame,
-                    text=f"📄 {relative_path}",
-                    width=200,
-                    height=30,
-                    anchor="w",
-                    command=lambda fp=str(file_path): self.open_project_file(fp)
-                )
-                file_btn.pack(pady=2, padx=5, fill="x")
-                
+            python_files = future.result()
         except Exception as e:
             messagebox.showerror("Error", f"Could not load project: {e}")
+            return
+        
+        self.project_files = [
+            (file_path, os.path.relpath(file_path, project_dir))
+            for file_path in python_files
+        ]
+        self._render_file_rows()
+    
+    def _on_file_list_resize(self, event=None) -> None:
+        """Redraw the file list when the canvas changes size."""
+        self._rendered_rows = None
+        self._render_file_rows()
+    
+    def _render_file_rows(self) -> None:
+        """
+        Draw the file names that fall inside the canvas viewport.
+        
+        Learning Notes:
+        - List virtualization: the scroll region is as tall as the whole
+          list, but text items exist only for the rows on screen
+        - A canvas text item is far cheaper than a widget, and scrolling or
+          resizing redraws just the visible window, so the cost stays the
+          same however many files the project has
+        """
+        
+        canvas = self.file_list_canvas
+        total = len(self.project_files)
+        
+        # Only touch the scroll region when it changes: setting it triggers another yview callback
+        if self._rendered_rows is None or self._rendered_rows[2] != total:
+            canvas.configure(scrollregion=(0, 0, canvas.winfo_width(), total * _FILE_ROW_HEIGHT))
+        
+        first = int(canvas.canvasy(0)) // _FILE_ROW_HEIGHT
+        end = min(total, int(canvas.canvasy(canvas.winfo_height())) // _FILE_ROW_HEIGHT + 1)
+        if (first, end, total) == self._rendered_rows:
+            return
+        self._rendered_rows = (first, end, total)
+        
+        self._clear_file_list_hover()
+        canvas.delete("row")
+        font = self._fonts(self.config)['label']
+        text_color = _appearance_color(ctk.ThemeManager.theme["CTkLabel"]["text_color"])
+        for index in range(first, end):
+            canvas.create_text(
+                8,
+                index * _FILE_ROW_HEIGHT + _FILE_ROW_HEIGHT // 2,
+                anchor="w",
+                text=f"📄 {self.project_files[index][1]}",
+                fill=text_color,
+                font=font,
+                tags="row"
+            )
+    
+    def _on_file_list_yview(self, first: str, last: str) -> None:
+        """Keep the scrollbar in step with the canvas and draw newly exposed rows."""
+        self.file_list_scrollbar.set(first, last)
+        self._render_file_rows()
+    
+    def _file_index_at(self, y: int) -> Optional[int]:
+        """Index of the file under a canvas y coordinate, or None past the end."""
+        index = int(self.file_list_canvas.canvasy(y)) // _FILE_ROW_HEIGHT
+        return index if 0 <= index < len(self.project_files) else None
+    
+    def _on_file_list_click(self, event) -> None:
+        """Open the clicked file."""
+        index = self._file_index_at(event.y)
+        if index is not None:
+            self.open_project_file(self.project_files[index][0])
+    
+    def _on_file_list_motion(self, event) -> None:
+        """
+        Highlight the row under the pointer and start reading its file.
+        
+        Learning Notes:
+        - Users usually click what they hover, so the read overlaps with
+          the time it takes to click; the click then hits the read cache
+        - If both prefetch slots are busy the hover is simply ignored
+        """
+        
+        index = self._file_index_at(event.y)
+        if index == self._hover_index:
+            return
+        
+        self._clear_file_list_hover()
+        if index is None:
+            return
+        self._hover_index = index
+        
+        canvas = self.file_list_canvas
+        top = index * _FILE_ROW_HEIGHT
+        canvas.create_rectangle(
+            0, top, canvas.winfo_width(), top + _FILE_ROW_HEIGHT,
+            fill=_appearance_color(ctk.ThemeManager.theme["CTkButton"]["hover_color"]),
+            outline="",
+            tags="hover"
+        )
+        canvas.tag_lower("hover")
+        
+        if _prefetch_slots.acquire(blocking=False):
+            _io_pool.submit(_prefetch_file, self.project_files[index][0])
+    
+    def _clear_file_list_hover(self, event=None) -> None:
+        """Remove the hover highlight."""
+        self._hover_index = None
+        self.file_list_canvas.delete("hover")
+    
+    def _on_file_list_wheel(self, event) -> None:
+        """Scroll the file list three rows per mouse wheel notch."""
+        
+        # Windows/macOS report a signed delta, X11 sends buttons 4 (up) and 5 (down)
+        down = event.num == 5 or event.delta < 0
+        self.file_list_canvas.yview_scroll(3 if down else -3, "units")
     
     def open_project_file(self, file_path: str) -> None:
         """Open a file from the project."""
         
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            self.code_editor.delete("1.0", "end")
-            self.code_editor.insert("1.0", content)
-            
-            self.current_file = file_path
-            self.current_file_label.configure(text=f"📄 {Path(file_path).name}")
-            self.modified_label.configure(text="")
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Could not open file: {e}")
+        self._load_file(file_path)
     
     def analyze_code(self) -> None:
-        """Analyze the current code with AI."""
+        """
+        Analyze the current code with AI.
+        
+        Learning Notes:
+        - The line count comes straight from the text widget's end index,
+          without copying any text
+        - The text is copied a few thousand lines at a time, so the whole
+          buffer is never one huge string in Python
+        - Tk may only be used from the main thread, so the text is copied
+          here and the counting runs on the worker pool
+        """
         
-        content = self.code_editor.get("1.0", "end-1c").strip()
+        total_lines = int(self.code_editor.index("end-1c").split(".")[0])
         
-        if not content:
+        # Chunks end on line boundaries, so the per-chunk counts simply add up
+        chunks = [
+            self.code_editor.get(f"{start}.0", f"{start + _ANALYSIS_CHUNK_LINES}.0")
+            for start in range(1, total_lines + 1, _ANALYSIS_CHUNK_LINES)
+        ]
+        
+        future = _io_pool.submit(_sum_line_stats, chunks)
+        future.add_done_callback(
+            lambda f: self.parent.after(0, self._show_analysis, total_lines, f)
+        )
+    
+    def _show_analysis(self, total_lines: int, future: Future) -> None:
+        """Show the finished analysis in a popup (main thread)."""
+        
+        try:
+            stats = future.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not analyze code: {e}")
+            return
+        
+        if not stats[0]:
             messagebox.showwarning("Warning", "No code to analyze")
             return
         
         # For now, show a placeholder analysis
-        analysis = self.get_basic_code_analysis(content)
+        analysis = self._format_analysis(total_lines, *stats)
         
         # Show analysis in a popup
         analysis_window = ctk.CTkToplevel(self.parent)
@@ -432,17 +915,24 @@ if __name__ == "__main__":
     def get_basic_code_analysis(self, code: str) -> str:
         """Provide basic code analysis."""
         
-        lines = code.split('\n')
+        # Same count as len(code.split('\n')) without building the list
+        total_lines = code.count('\n') + 1
+        
+        return self._format_analysis(total_lines, *_code_line_stats(code))
+    
+    def _format_analysis(self, total_lines: int, non_empty: int, comments: int,
+                         functions: int, classes: int) -> str:
+        """Build the analysis report from the line statistics."""
         
         analysis = f"""
 🤖 Code Analysis Report
 
 📊 Basic Statistics:
-• Total lines: {len(lines)}
-• Non-empty lines: {len([line for line in lines if line.strip()])}
-• Comment lines: {len([line for line in lines if line.strip().startswith('#')])}
-• Function definitions: {len([line for line in lines if 'def ' in line])}
-• Class definitions: {len([line for line in lines if 'class ' in line])}
+• Total lines: {total_lines}
+• Non-empty lines: {non_empty}
+• Comment lines: {comments}
+• Function definitions: {functions}
+• Class definitions: {classes}
 
 💡 Quick Suggestions:
 • Add docstrings to functions for better documentation
@@ -470,44 +960,17 @@ Note: For advanced AI analysis, add your OpenAI or Anthropic API key to enable f
     def generate_documentation(self) -> None:
         """Generate documentation for the current code."""
         
-        messagebox.showinfo(
-            "AI Documentation",
-            "Documentation generation requires AI API key setup.\n\n"
-            "This feature will:\n"
-            "• Generate docstrings for functions\n"
-            "• Create README files\n"
-            "• Document API endpoints\n"
-            "• Explain complex algorithms\n\n"
-            "Add your OpenAI/Anthropic API key to enable this feature."
-        )
+        messagebox.showinfo(*_AI_MESSAGES['docs'])
     
     def suggest_refactoring(self) -> None:
         """Suggest code refactoring improvements."""
         
-        messagebox.showinfo(
-            "AI Refactoring",
-            "Code refactoring suggestions require AI API key setup.\n\n"
-            "This feature will:\n"
-            "• Suggest code optimizations\n"
-            "• Identify code smells\n"
-            "• Recommend design patterns\n"
-            "• Improve code structure\n\n"
-            "Add your OpenAI/Anthropic API key to enable this feature."
-        )
+        messagebox.showinfo(*_AI_MESSAGES['refactor'])
     
     def explain_code(self) -> None:
         """Explain the current code."""
         
-        messagebox.showinfo(
-            "AI Code Explanation",
-            "Code explanation requires AI API key setup.\n\n"
-            "This feature will:\n"
-            "• Explain complex algorithms\n"
-            "• Describe function purposes\n"
-            "• Clarify code logic\n"
-            "• Provide learning insights\n\n"
-            "Add your OpenAI/Anthropic API key to enable this feature."
-        )
+        messagebox.showinfo(*_AI_MESSAGES['explain'])
     
     def add_to_recent_files(self, file_path: str) -> None:
         """Add file to recent files list."""
@@ -517,11 +980,29 @@ Note: For advanced AI analysis, add your OpenAI or Anthropic API key to enable f
         pass
     
     def on_text_change(self, event=None) -> None:
-        """Handle text changes in the editor."""
+        """
+        Handle text changes in the editor.
+        
+        Learning Notes:
+        - Bound to every key press, so it only queues work: however fast
+          the user types, one check runs per idle cycle
+        """
+        
+        # Nothing can be typed while a large file is still being inserted
+        if self._is_modified or self._dirty_pending or self._streaming is not None:
+            return
+        
+        self._dirty_pending = True
+        self.parent.after_idle(self._flush_dirty)
+    
+    def _flush_dirty(self) -> None:
+        """Show the modified marker once per burst of edits."""
+        
+        self._dirty_pending = False
         
-        # Mark file as modified
-        if self.current_file and "●" not in self.modified_label.cget("text"):
+        # Mark file as modified; the label only changes on the transition
+        if self.current_file and not self._is_modified:
+            self._is_modified = True
             self.modified_label.configure(text="● Modified")
         
-        # Here you could add syntax highlighting, auto-completion, etc.
-        pass 
\ No newline at end of file
+        # Here you could add syntax highlighting, auto-completion, etc. 
\ No newline at end of file
@@ -10,11 +10,50 @@ Learning Notes:
 
 import customtkinter as ctk
 import tkinter as tk
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, NamedTuple, Optional, Tuple
+import hashlib
+import json
+import os
+import tempfile
 import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
 from apis.fonts_api import FontsAPI
 from utils.config import Config
 
+# Font lists saved after each fetch, shown at once on the next start while
+# a background fetch revalidates them
+_CATALOG_VERSION = 2
+_CATALOG_MAX_AGE = 24 * 60 * 60  # 24 hours
+
+# Quiet period after the last keystroke before the search is applied
+_SEARCH_DEBOUNCE_MS = 150
+
+# Font list rows built once and reused as a window over the filtered list
+_FONT_LIST_ROWS = 30
+_FONT_LIST_OVERSCAN = 5  # Rows kept rendered above the first visible one
+_FONT_ROW_STRIDE_GUESS = 56  # Pixels per row until the rendered rows are measured
+
+# System font buttons created per idle slice
+_SYSTEM_FONT_BATCH = 10
+
+# Preview fonts kept alive for reuse, least recently used dropped first
+_PREVIEW_FONT_CACHE_SIZE = 32
+
+def _fingerprint_catalog(all_fonts: List[Dict[str, Any]],
+                         coding_fonts: List[Dict[str, Any]]) -> str:
+    """Digest the font lists as JSON sees them, so tuples and lists compare equal."""
+    payload = json.dumps([all_fonts, coding_fonts], sort_keys=True, separators=(',', ':'))
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+class _FontRow(NamedTuple):
+    """The widgets making up one reusable font list row."""
+    item_frame: ctk.CTkFrame
+    name_label: ctk.CTkLabel
+    info_label: ctk.CTkLabel
+    preview_btn: ctk.CTkButton
+
 class FontManagerWidget:
     """
     Font management widget with preview and selection features.
@@ -38,25 +77,72 @@ class FontManagerWidget:
         # Font data
         self.all_fonts = []
         self.coding_fonts = []
+        
+        # Columns derived from the lists above once per load (see _set_catalog)
+        self._family_lower: List[str] = []
+        self._by_category: Dict[str, List[int]] = {}
+        self._bigram_index: Dict[str, List[int]] = {}
+        
+        # (category, lowercase query, matching positions) of the last filter
+        self._last_filter: Optional[Tuple[str, str, Any]] = None
+        self._coding_lower: List[str] = []
+        self._coding_families: frozenset = frozenset()
+        self._catalog_fingerprint: Optional[str] = None  # Digest of the lists shown
         self.current_fonts = []
         self.selected_font = None
         
+        # Preview fonts keyed by (family, size)
+        self._font_cache: "OrderedDict[Tuple[Optional[str], int], ctk.CTkFont]" = OrderedDict()
+        
         # Search and filter state
         self.search_query = ""
         self.current_category = "all"
-        
-        # Create the interface
+        self._search_after_id: Optional[str] = None  # Pending debounced search
+        self._status_after_id: Optional[str] = None  # Pending "Ready" reset
+        
+        # On-disk snapshot of the last fetched catalog
+        self._catalog_file = Path(self.fonts_api.cache_dir) / 'fonts_catalog.json'
+        
+        # Results handed from the fetch thread to the Tk thread
+        self._pending_fonts: Optional[tuple] = None
+        self._pending_error: Optional[str] = None
+        self._system_fonts: Optional[List[Dict[str, Any]]] = None  # Coding-suitable, set by the thread
+        self._system_fonts_shown = False
+        self.parent.bind("<<FontsLoaded>>", self._on_fonts_loaded)
+        self.parent.bind("<<FontsError>>", self._on_fonts_error)
+        
+        # Create the interface: the cheap frame first, the heavy parts
+        # (row pool, preview) and the font load in later idle passes
         self.setup_layout()
         self.setup_header()
         self.setup_controls()
-        self.setup_font_list()
-        self.setup_preview()
-        
-        # Load fonts
-        self.load_fonts()
+        self.parent.after_idle(self._setup_font_list_stage)
         
         print("🔤 Font manager widget initialized")
     
+    def _setup_font_list_stage(self) -> None:
+        """
+        Second setup stage: build the font list, then queue the preview.
+        
+        Learning Notes:
+        - Staged construction: each stage queues the next with after_idle,
+          and idle callbacks queued from an idle callback wait for the next
+          pass, so Tk can draw the header and controls in between
+        - The controls stay disabled until the list they filter exists
+        """
+        
+        self.setup_font_list()
+        for control in (self.search_entry, self.category_menu,
+                        self.refresh_btn, self.coding_fonts_btn):
+            control.configure(state="normal")
+        self.parent.after_idle(self._setup_preview_stage)
+    
+    def _setup_preview_stage(self) -> None:
+        """Third setup stage: build the preview, then start loading fonts."""
+        
+        self.setup_preview()
+        self.parent.after_idle(self.load_fonts)
+    
     def setup_layout(self) -> None:
         """Set up the main layout for the font manager."""
         
@@ -108,7 +194,7 @@ class FontManagerWidget:
         self.status_label.pack(side="right", padx=20, pady=15)
     
     def setup_controls(self) -> None:
-        """Set up the font search and filter controls."""
+        """Set up the font search and filter controls (disabled until the list is built)."""
         
         # Search section
         search_frame = ctk.CTkFrame(self.controls_frame, fg_color="transparent")
@@ -123,6 +209,7 @@ class FontManagerWidget:
             width=200
         )
         self.search_entry.pack(pady=(0, 5))
+        self.search_entry.configure(state="disabled")  # After the placeholder is drawn
         self.search_entry.bind("<KeyRelease>", self.on_search_change)
         
         # Category filter
@@ -138,7 +225,8 @@ class FontManagerWidget:
             values=["all", "serif", "sans-serif", "monospace", "display", "handwriting", "coding"],
             variable=self.category_var,
             command=self.on_category_change,
-            width=150
+            width=150,
+            state="disabled"
         )
         self.category_menu.pack()
         
@@ -150,7 +238,8 @@ class FontManagerWidget:
             button_frame,
             text="🔄 Refresh",
             width=100,
-            command=self.refresh_fonts
+            command=self.refresh_fonts,
+            state="disabled"
         )
         self.refresh_btn.pack(side="right", padx=5)
         
@@ -160,7 +249,8 @@ class FontManagerWidget:
             width=120,
             command=self.show_coding_fonts,
             fg_color="green",
-            hover_color="darkgreen"
+            hover_color="darkgreen",
+            state="disabled"
         )
         self.coding_fonts_btn.pack(side="right", padx=5)
     
@@ -175,10 +265,28 @@ class FontManagerWidget:
         )
         list_title.grid(row=0, column=0, padx=10, pady=10, sticky="w")
         
-        # Font list
+        # Font list: a fixed pool of rows, refilled rather than rebuilt on each filter
         self.font_list = ctk.CTkScrollableFrame(self.list_frame, height=400)
         self.font_list.grid(row=1, column=0, sticky="nsew", padx=10, pady=(0, 10))
         
+        # Spacers stand in for the rows above and below the rendered window
+        self._top_spacer = tk.Frame(self.font_list, height=1, bd=0, highlightthickness=0)
+        self._bottom_spacer = tk.Frame(self.font_list, height=1, bd=0, highlightthickness=0)
+        self._top_spacer.pack(fill="x")
+        self._bottom_spacer.pack(fill="x")
+        
+        self._row_name_font = ctk.CTkFont(size=12, weight="bold")
+        self._row_info_font = ctk.CTkFont(size=10)
+        self._row_font_idx = [0] * _FONT_LIST_ROWS  # Position in current_fonts shown by each row
+        self._row_pool = [self._make_row(slot) for slot in range(_FONT_LIST_ROWS)]
+        self._rows_packed = 0
+        self._window_start: Optional[int] = None
+        self._row_stride: Optional[int] = None
+        
+        # Every scroll (wheel, scrollbar drag, resize) reports through yscrollcommand
+        self._font_list_scrollbar_set = self.font_list._scrollbar.set
+        self.font_list._parent_canvas.configure(yscrollcommand=self._on_font_list_yview)
+        
         # Info section
         info_frame = ctk.CTkFrame(self.list_frame, height=80)
         info_frame.grid(row=2, column=0, sticky="ew", padx=10, pady=(0, 10))
@@ -200,8 +308,6 @@ class FontManagerWidget:
         
         self.system_fonts_frame = ctk.CTkFrame(self.list_frame, height=100)
         self.system_fonts_frame.grid(row=4, column=0, sticky="ew", padx=10, pady=(0, 10))
-        
-        self.show_system_fonts()
     
     def setup_preview(self) -> None:
         """Set up the font preview area."""
@@ -309,70 +415,271 @@ Sed do eiusmod tempor incididunt ut labore et dolore magna aliqua."""
         self.pairing_btn.pack(side="right", padx=5, pady=10)
     
     def load_fonts(self) -> None:
-        """Load fonts in background thread."""
+        """
+        Load fonts in background thread.
+        
+        Learning Notes:
+        - Stale-while-revalidate: a recent catalog saved on disk is shown
+          immediately, and the background fetch only refreshes it
+        - The list is rebuilt again only if the fetch found something new
+        - The thread hands its result over with a Tk virtual event: the
+          data waits in an attribute and one bound handler picks it up
+        """
+        
+        cached = self._load_catalog_cache()
+        if cached:
+            self.update_font_list()
+        else:
+            self.update_status("Loading font catalog...")
+        shown = self._catalog_fingerprint
         
         def fetch_fonts():
             try:
-                self.update_status("Loading font catalog...")
+                # System fonts are listed once, alongside the first catalog load
+                if self._system_fonts is None:
+                    self._system_fonts = [
+                        f for f in self.fonts_api.get_system_fonts()
+                        if f.get('suitable_for_coding', False)
+                    ]
                 
-                # Load all fonts
-                self.all_fonts = self.fonts_api.get_font_families()
+                # Load all fonts; the coding fonts are filtered from the same
+                # list, so this second call reuses it instead of fetching again
+                all_fonts = self.fonts_api.get_font_families()
+                coding_fonts = self.fonts_api.get_coding_fonts()
                 
-                # Load coding fonts
-                self.coding_fonts = self.fonts_api.get_coding_fonts()
+                # Update UI on main thread before the slower catalog write;
+                # the fetched lists are compared by digest, as the saved
+                # catalog went through JSON and the fetched one did not
+                fingerprint = _fingerprint_catalog(all_fonts, coding_fonts)
+                if fingerprint != shown:
+                    self._pending_fonts = (all_fonts, coding_fonts, fingerprint)
+                self.parent.event_generate("<<FontsLoaded>>", when="tail")
                 
-                # Update UI on main thread
-                self.parent.after(0, self.update_font_list)
+                self._save_catalog_cache(all_fonts, coding_fonts, fingerprint)
                 
             except Exception as e:
-                self.parent.after(0, lambda: self.update_status(f"Error: {str(e)}"))
+                self._pending_error = f"Error: {str(e)}"
+                self.parent.event_generate("<<FontsError>>", when="tail")
         
         # Start background thread
         threading.Thread(target=fetch_fonts, daemon=True).start()
     
+    def _on_fonts_loaded(self, event=None) -> None:
+        """Show the font lists left by the fetch thread."""
+        
+        pending, self._pending_fonts = self._pending_fonts, None
+        if pending is not None:
+            self._set_catalog(*pending)
+            self.update_font_list()
+        
+        self.show_system_fonts()
+    
+    def _on_fonts_error(self, event=None) -> None:
+        """Report the error left by the fetch thread."""
+        
+        message, self._pending_error = self._pending_error, None
+        if message:
+            self.update_status(message)
+        
+        self.show_system_fonts()
+    
+    def _set_catalog(self, all_fonts: List[Dict[str, Any]],
+                     coding_fonts: List[Dict[str, Any]], fingerprint: str) -> None:
+        """
+        Store the font lists together with their precomputed filter columns.
+        
+        Learning Notes:
+        - Struct of arrays: lowercased names are kept in plain lists
+          parallel to the font dicts, built once per load, so filtering
+          never calls .get() or .lower() per font per keystroke
+        - Categories map to the positions of their fonts, so switching
+          category is a dict lookup instead of a scan of every font
+        - Every two-letter sequence of a name maps to the fonts containing
+          it; a search only scans the fonts sharing its rarest pair
+        """
+        
+        family_lower = [f.get('family', '').lower() for f in all_fonts]
+        by_category: Dict[str, List[int]] = {}
+        for i, font in enumerate(all_fonts):
+            by_category.setdefault(font.get('category', 'unknown'), []).append(i)
+        bigram_index: Dict[str, List[int]] = {}
+        for i, name in enumerate(family_lower):
+            for bigram in {name[j:j + 2] for j in range(len(name) - 1)}:
+                bigram_index.setdefault(bigram, []).append(i)
+        coding_lower = [f.get('family', '').lower() for f in coding_fonts]
+        
+        self.all_fonts = all_fonts
+        self.coding_fonts = coding_fonts
+        self._family_lower = family_lower
+        self._by_category = by_category
+        self._bigram_index = bigram_index
+        self._last_filter = None  # Positions refer to the previous lists
+        self._coding_lower = coding_lower
+        self._coding_families = frozenset(f.get('family') for f in coding_fonts)
+        self._catalog_fingerprint = fingerprint
+    
+    def _load_catalog_cache(self) -> bool:
+        """Use the font lists saved by the last fetch if they are recent enough."""
+        
+        try:
+            with open(self._catalog_file, 'r', encoding='utf-8') as f:
+                catalog = json.load(f)
+            
+            if (catalog.get('version') != _CATALOG_VERSION or
+                    time.time() - catalog.get('fetched_at', 0) > _CATALOG_MAX_AGE):
+                return False
+            
+            self._set_catalog(catalog['all_fonts'], catalog['coding_fonts'], catalog['fingerprint'])
+            return True
+            
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            # Missing or unreadable: fall back to fetching from the fonts API
+            return False
+    
+    def _save_catalog_cache(self, all_fonts: List[Dict[str, Any]],
+                            coding_fonts: List[Dict[str, Any]], fingerprint: str) -> None:
+        """Save the fetched font lists atomically for the next start."""
+        
+        catalog = {
+            'version': _CATALOG_VERSION,
+            'fetched_at': time.time(),
+            'fingerprint': fingerprint,
+            'all_fonts': all_fonts,
+            'coding_fonts': coding_fonts
+        }
+        
+        # Write a temporary file and swap it in, so readers never see half a catalog
+        tmp_path = None
+        try:
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=self._catalog_file.parent,
+                                             suffix='.tmp', delete=False) as f:
+                tmp_path = f.name
+                json.dump(catalog, f, separators=(',', ':'))
+            os.replace(tmp_path, self._catalog_file)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"⚠️  Could not save font catalog: {e}")
+            if tmp_path:
+                Path(tmp_path).unlink(missing_ok=True)
+    
     def update_font_list(self) -> None:
-        """Update the font list display."""
+        """
+        Update the font list display.
         
-        # Clear existing items
-        for widget in self.font_list.winfo_children():
-            widget.destroy()
+        Learning Notes:
+        - Incremental filtering: when the query only grew and the category
+          is unchanged, the new matches are a subset of the last ones, so
+          only those are checked again
+        """
         
-        # Determine which fonts to show
+        # Determine which fonts to show, as positions in the source list
         if self.current_category == "coding":
-            fonts_to_show = self.coding_fonts
-        elif self.current_category == "all":
-            fonts_to_show = self.all_fonts
+            source, names = self.coding_fonts, self._coding_lower
+            indices = range(len(source))
         else:
-            fonts_to_show = [f for f in self.all_fonts if f.get('category') == self.current_category]
+            source, names = self.all_fonts, self._family_lower
+            if self.current_category == "all":
+                indices = range(len(source))
+            else:
+                indices = self._by_category.get(self.current_category, [])
+        
+        # Apply search filter against the prebuilt lowercase names
+        query = self.search_query.lower()
+        if query:
+            previous = self._last_filter
+            if (previous is not None and previous[0] == self.current_category and
+                    len(previous[1]) >= 2 and query.startswith(previous[1])):
+                indices = previous[2]
+            elif names is self._family_lower and len(query) >= 2:
+                # A match contains every pair of the query, so the rarest
+                # pair's fonts (in list order) hold all candidates
+                candidates = min(
+                    (self._bigram_index.get(query[j:j + 2], []) for j in range(len(query) - 1)),
+                    key=len
+                )
+                if self.current_category != "all":
+                    category = self.current_category
+                    candidates = [i for i in candidates
+                                  if source[i].get('category', 'unknown') == category]
+                indices = candidates
+            indices = [i for i in indices if query in names[i]]
+        self._last_filter = (self.current_category, query, indices)
         
-        # Apply search filter
-        if self.search_query:
-            fonts_to_show = [
-                f for f in fonts_to_show 
-                if self.search_query.lower() in f.get('family', '').lower()
-            ]
+        fonts_to_show = [source[i] for i in indices]
         
         self.current_fonts = fonts_to_show
         
-        # Create font items
-        for font in fonts_to_show[:50]:  # Limit to 50 for performance
-            self.create_font_item(font)
+        # New results start from the top
+        self._window_start = None
+        self.font_list._parent_canvas.yview_moveto(0)
+        self._render_font_window(0)
         
         # Update count
         self.font_count_label.configure(text=f"Fonts: {len(fonts_to_show)}")
         
         # Update status
-        if len(fonts_to_show) > 50:
-            self.update_status(f"Showing first 50 of {len(fonts_to_show)} fonts")
-        else:
-            self.update_status(f"Loaded {len(fonts_to_show)} fonts")
+        self.update_status(f"Loaded {len(fonts_to_show)} fonts")
     
-    def create_font_item(self, font: Dict[str, Any]) -> None:
-        """Create a font item in the list."""
+    def _on_font_list_yview(self, first: str, last: str) -> None:
+        """Move the scrollbar and the rendered window along with the list."""
+        
+        self._font_list_scrollbar_set(first, last)
+        self._render_font_window(int(float(first) * len(self.current_fonts)))
+    
+    def _render_font_window(self, first_visible: int) -> None:
+        """
+        Fill the row pool with the fonts around the first visible position.
+        
+        Learning Notes:
+        - Windowed rendering: only about a screenful of rows exists, however
+          long the list is; spacers sized like the missing rows keep the
+          scrollbar proportional to the whole list
+        - Rows are only refilled when the window actually moves
+        """
+        
+        fonts = self.current_fonts
+        start = max(0, min(first_visible - _FONT_LIST_OVERSCAN, len(fonts) - _FONT_LIST_ROWS))
+        if start == self._window_start:
+            return
+        self._window_start = start
+        
+        window = fonts[start:start + _FONT_LIST_ROWS]
+        for slot, (row, font) in enumerate(zip(self._row_pool, window)):
+            self._row_font_idx[slot] = start + slot
+            self._fill_row(row, font)
+        
+        # Rows in use are always a prefix of the pool, so packing keeps their order
+        for row in self._row_pool[self._rows_packed:len(window)]:
+            row.item_frame.pack(fill="x", pady=2, padx=5, before=self._bottom_spacer)
+        for row in self._row_pool[len(window):self._rows_packed]:
+            row.item_frame.pack_forget()
+        self._rows_packed = len(window)
+        
+        # Measure the real row pitch once two rows have been laid out
+        if self._row_stride is None and len(window) >= 2:
+            self.font_list.update_idletasks()
+            stride = self._row_pool[1].item_frame.winfo_y() - self._row_pool[0].item_frame.winfo_y()
+            if stride > 0:
+                self._row_stride = stride
+        
+        stride = self._row_stride or _FONT_ROW_STRIDE_GUESS
+        bg = tk.Frame.cget(self.font_list, "bg")
+        self._top_spacer.configure(height=max(start * stride, 1), bg=bg)
+        self._bottom_spacer.configure(
+            height=max((len(fonts) - start - len(window)) * stride, 1), bg=bg)
+    
+    def _make_row(self, slot: int) -> _FontRow:
+        """
+        Build one empty font list row (done once per pool slot).
+        
+        Learning Notes:
+        - Creating customtkinter widgets is expensive, so the rows are
+          created once and only their text changes afterwards
+        - The preview command is bound once to the row's slot; the font is
+          looked up when clicked, so refilling a row creates no closures
+        """
         
         # Font item frame
         item_frame = ctk.CTkFrame(self.font_list)
-        item_frame.pack(fill="x", pady=2, padx=5)
         
         # Font info frame
         info_frame = ctk.CTkFrame(item_frame, fg_color="transparent")
@@ -381,25 +688,17 @@ Sed do eiusmod tempor incididunt ut labore et dolore magna aliqua."""
         # Font name
         name_label = ctk.CTkLabel(
             info_frame,
-            text=font.get('family', 'Unknown'),
-            font=ctk.CTkFont(size=12, weight="bold"),
+            text="",
+            font=self._row_name_font,
             anchor="w"
         )
         name_label.pack(anchor="w")
         
         # Font category and info
-        category = font.get('category', 'unknown')
-        variants = len(font.get('variants', []))
-        info_text = f"Category: {category} • Variants: {variants}"
-        
-        # Add coding indicator
-        if font.get('recommended_for_coding', False):
-            info_text += " • ⌨️ Coding"
-        
         info_label = ctk.CTkLabel(
             info_frame,
-            text=info_text,
-            font=ctk.CTkFont(size=10),
+            text="",
+            font=self._row_info_font,
             text_color="gray",
             anchor="w"
         )
@@ -410,25 +709,67 @@ Sed do eiusmod tempor incididunt ut labore et dolore magna aliqua."""
             item_frame,
             text="👁️",
             width=40,
-            command=lambda f=font: self.preview_font(f)
+            command=lambda: self._dispatch_preview(slot)
         )
         preview_btn.pack(side="right", padx=10, pady=5)
+        
+        return _FontRow(item_frame, name_label, info_label, preview_btn)
+    
+    def _fill_row(self, row: _FontRow, font: Dict[str, Any]) -> None:
+        """Show a font in a pooled row."""
+        
+        # Font category and info
+        category = font.get('category', 'unknown')
+        variants = len(font.get('variants', []))
+        info_text = f"Category: {category} • Variants: {variants}"
+        
+        # Add coding indicator (the catalog entries themselves carry no coding metadata)
+        if font.get('recommended_for_coding', False) or font.get('family') in self._coding_families:
+            info_text += " • ⌨️ Coding"
+        
+        row.name_label.configure(text=font.get('family', 'Unknown'))
+        row.info_label.configure(text=info_text)
+    
+    def _dispatch_preview(self, slot: int) -> None:
+        """Preview the font currently shown in a pooled row."""
+        
+        index = self._row_font_idx[slot]
+        if index < len(self.current_fonts):
+            self.preview_font(self.current_fonts[index])
     
     def show_system_fonts(self) -> None:
-        """Display available system fonts."""
-        
-        system_fonts = self.fonts_api.get_system_fonts()
-        
-        for font in system_fonts:
-            if font.get('suitable_for_coding', False):
-                font_btn = ctk.CTkButton(
-                    self.system_fonts_frame,
-                    text=f"⌨️ {font['family']}",
-                    width=180,
-                    height=25,
-                    command=lambda f=font: self.preview_system_font(f)
-                )
-                font_btn.pack(pady=1, padx=5)
+        """
+        Display available system fonts.
+        
+        Learning Notes:
+        - The font list comes from the background thread; the buttons are
+          created a few at a time in idle callbacks, so Tk can handle
+          input and redraws between batches
+        """
+        
+        if self._system_fonts is None or self._system_fonts_shown:
+            return
+        
+        self._system_fonts_shown = True
+        self.parent.after_idle(self._populate_system_fonts_batch, 0)
+    
+    def _populate_system_fonts_batch(self, start: int) -> None:
+        """Create the next batch of system font buttons, then yield to Tk."""
+        
+        end = start + _SYSTEM_FONT_BATCH
+        for font in self._system_fonts[start:end]:
+            font_btn = ctk.CTkButton(
+                self.system_fonts_frame,
+                text=f"⌨️ {font['family']}",
+                width=180,
+                height=25,
+                command=lambda f=font: self.preview_system_font(f)
+            )
+            font_btn.pack(pady=1, padx=5)
+        
+        # Idle callbacks added while idle ones run wait for the next idle pass
+        if end < len(self._system_fonts):
+            self.parent.after_idle(self._populate_system_fonts_batch, end)
     
     def preview_font(self, font: Dict[str, Any]) -> None:
         """Preview a selected font."""
@@ -460,24 +801,62 @@ Sed do eiusmod tempor incididunt ut labore et dolore magna aliqua."""
         
         # Try to apply the system font
         try:
-            new_font = ctk.CTkFont(family=family, size=int(self.size_var.get()))
-            self.preview_text.configure(font=new_font)
+            new_font = self._get_font(family, int(self.size_var.get()))
+            self._set_preview_font(new_font)
             self.update_status(f"Applied system font: {family}")
         except Exception as e:
             self.update_status(f"Could not apply font: {family}")
     
+    def _get_font(self, family: Optional[str], size: int) -> ctk.CTkFont:
+        """
+        Return a preview font, reusing the one made for the same family and size.
+        
+        Learning Notes:
+        - Each CTkFont registers a new named font with Tk, so going back
+          and forth between sizes would otherwise keep creating fonts
+        - An LRU bound keeps browsing many families from growing the cache
+        """
+        
+        key = (family, size)
+        font = self._font_cache.get(key)
+        if font is not None:
+            self._font_cache.move_to_end(key)
+            return font
+        
+        font = ctk.CTkFont(family=family, size=size)
+        self._font_cache[key] = font
+        if len(self._font_cache) > _PREVIEW_FONT_CACHE_SIZE:
+            self._font_cache.popitem(last=False)
+        return font
+    
+    def _set_preview_font(self, font: ctk.CTkFont) -> None:
+        """
+        Switch the preview text to another font with a single re-layout.
+        
+        Learning Notes:
+        - Pending geometry work is flushed first, then the textbox is taken
+          out of the grid while its font changes, so the text is measured
+          once when it comes back instead of reflowing while on screen
+        - grid_remove() remembers the grid options for the next grid()
+        """
+        
+        self.preview_text.update_idletasks()
+        self.preview_text.grid_remove()
+        self.preview_text.configure(font=font)
+        self.preview_text.grid()
+    
     def update_preview_size(self, size: str) -> None:
         """Update preview text size."""
         
         try:
             if self.selected_font and 'family' in self.selected_font:
                 family = self.selected_font['family']
-                new_font = ctk.CTkFont(family=family, size=int(size))
-                self.preview_text.configure(font=new_font)
+                new_font = self._get_font(family, int(size))
+                self._set_preview_font(new_font)
         except:
             # Use default font with new size
-            new_font = ctk.CTkFont(size=int(size))
-            self.preview_text.configure(font=new_font)
+            new_font = self._get_font(None, int(size))
+            self._set_preview_font(new_font)
     
     def apply_font_to_editor(self) -> None:
         """Apply selected font to the code editor."""
@@ -514,12 +893,29 @@ Sed do eiusmod tempor incididunt ut labore et dolore magna aliqua."""
         self.update_font_list()
     
     def refresh_fonts(self) -> None:
-        """Refresh the font list."""
+        """Refresh the font list from the API, bypassing the catalogs saved on disk."""
+        
+        self._catalog_file.unlink(missing_ok=True)
+        self.fonts_api.invalidate('families', bypass_disk=True)
         self.load_fonts()
     
     def on_search_change(self, event=None) -> None:
-        """Handle search query changes."""
+        """
+        Handle search query changes.
         
+        Learning Notes:
+        - Debouncing: each keystroke restarts a short timer, so a burst of
+          typing filters the list once instead of once per character
+        """
+        
+        if self._search_after_id is not None:
+            self.parent.after_cancel(self._search_after_id)
+        self._search_after_id = self.parent.after(_SEARCH_DEBOUNCE_MS, self._apply_search)
+    
+    def _apply_search(self) -> None:
+        """Filter the list with the query typed so far."""
+        
+        self._search_after_id = None
         self.search_query = self.search_entry.get()
         self.update_font_list()
     
@@ -533,7 +929,16 @@ Sed do eiusmod tempor incididunt ut labore et dolore magna aliqua."""
         """Update status message."""
         
         self.status_label.configure(text=message)
-        print(f"Font Manager: {message}")
+        if self.config.get('debug', False):
+            print(f"Font Manager: {message}")
+        
+        # Clear status after 5 seconds; a newer message restarts the timer
+        if self._status_after_id is not None:
+            self.parent.after_cancel(self._status_after_id)
+        self._status_after_id = self.parent.after(5000, self._reset_status)
+    
+    def _reset_status(self) -> None:
+        """Show the idle status once messages have gone quiet."""
         
-        # Clear status after 5 seconds
-        self.parent.after(5000, lambda: self.status_label.configure(text="Ready")) 
\ No newline at end of file
+        self._status_after_id = None
+        self.status_label.configure(text="Ready") 
\ No newline at end of file
@@ -0,0 +1,145 @@
+"""Tests for the FontsAPI catalog caches."""
+
+import time
+
+import pytest
+
+from apis.fonts_api import FontsAPI
+
+_FAMILIES = [
+    {'family': 'Roboto', 'family_lower': 'roboto', 'category': 'sans-serif',
+     'variants': ['regular', '700'], 'subsets': ['latin']},
+    {'family': 'Merriweather', 'family_lower': 'merriweather', 'category': 'serif',
+     'variants': ['regular'], 'subsets': ['latin', 'cyrillic']},
+    {'family': 'Fira Code', 'family_lower': 'fira code', 'category': 'monospace',
+     'variants': ['regular'], 'subsets': ['latin']},
+    {'family': 'Open Sans', 'family_lower': 'open sans', 'category': 'sans-serif',
+     'variants': ['regular', 'italic', '700'], 'subsets': ['latin', 'greek']},
+]
+
+@pytest.fixture
+def fonts_api(config):
+    """A FontsAPI serving a small in-memory catalog."""
+    
+    api = FontsAPI(config)
+    api._index_families([dict(font) for font in _FAMILIES], time.time())
+    return api
+
+def test_coding_fonts_leave_catalog_unchanged(fonts_api):
+    before = [dict(font) for font in fonts_api.get_font_families()]
+    
+    coding = fonts_api.get_coding_fonts()
+    
+    assert [font['family'] for font in coding] == ['Fira Code']
+    assert coding[0]['recommended_for_coding'] is True
+    assert coding[0]['ligatures_support'] is True
+    assert fonts_api.get_font_families() == before
+
+def test_coding_fonts_memoized_per_families_version(fonts_api):
+    first = fonts_api.get_coding_fonts()
+    assert fonts_api.get_coding_fonts() is first
+    
+    fonts_api._index_families([dict(font) for font in _FAMILIES], time.time())
+    assert fonts_api.get_coding_fonts() is first  # Same list, same version
+    
+    fonts_api._index_families([dict(font) for font in _FAMILIES[:3]], time.time())
+    assert fonts_api.get_coding_fonts() is not first
+
+def test_fallback_families_are_indexed_once(config):
+    api = FontsAPI(config)  # No API key: the built-in fallback list
+    coding = api.get_coding_fonts()
+    version = api._families_version
+    
+    api.get_font_details('Arial')
+    
+    assert api.get_coding_fonts() is coding
+    assert api._families_version == version
+
+def test_font_details_for_known_family(fonts_api):
+    details = fonts_api.get_font_details('open sans')
+    
+    assert details['family'] == 'Open Sans'
+    assert details['category'] == 'sans-serif'
+    assert details['popularity'] == 4
+    assert details['characteristics']['weights'] == [400, 700]
+    assert details['characteristics']['has_italic'] is True
+    assert 'Body text' in details['usage_recommendations']
+
+def test_font_details_batch_mixes_hits_and_defaults(fonts_api):
+    results = fonts_api.get_font_details_batch(['Roboto', 'No Such Font'])
+    
+    assert results['Roboto']['family'] == 'Roboto'
+    assert results['No Such Font']['family'] == 'No Such Font'
+    assert results['No Such Font']['found'] is False
+
+def test_font_pairings_follow_category_rules(fonts_api):
+    pairings = fonts_api.get_font_pairings('Roboto')
+    
+    # sans-serif pairs with serif and monospace, never with itself
+    assert {p['secondary_font'] for p in pairings} == {'Merriweather', 'Fira Code'}
+    assert [p['harmony_score'] for p in pairings] == sorted(
+        (p['harmony_score'] for p in pairings), reverse=True)
+    by_font = {p['secondary_font']: p for p in pairings}
+    assert by_font['Merriweather']['contrast_level'] == 'High'
+    assert by_font['Fira Code']['use_case'].startswith('Code samples in Fira Code')
+
+def test_font_pairings_for_unknown_font(fonts_api):
+    pairings = fonts_api.get_font_pairings('No Such Font')
+    
+    assert {p['secondary_font'] for p in pairings} == {'Merriweather', 'Fira Code'}
+
+def test_font_details_misses_are_cached(fonts_api, monkeypatch):
+    first = fonts_api.get_font_details('No Such Font')
+    
+    def no_catalog(*args, **kwargs):
+        raise AssertionError("catalog consulted for a cached miss")
+    
+    monkeypatch.setattr(fonts_api, 'get_font_families', no_catalog)
+    assert fonts_api.get_font_details('No Such Font') is first
+
+def test_invalidate_font_cache_drops_one_family(fonts_api):
+    roboto = fonts_api.get_font_details('Roboto')
+    missing = fonts_api.get_font_details('No Such Font')
+    
+    fonts_api.invalidate_font_cache('No Such Font')
+    
+    assert fonts_api.get_font_details('Roboto') is roboto
+    assert fonts_api.get_font_details('No Such Font') is not missing
+
+def test_invalidate_font_cache_drops_everything(fonts_api):
+    roboto = fonts_api.get_font_details('Roboto')
+    fonts_api.get_font_details('No Such Font')
+    
+    fonts_api.invalidate_font_cache()
+    
+    assert fonts_api.font_cache == {}
+    assert fonts_api.get_font_details('Roboto') is not roboto
+
+def test_invalidate_families_drops_derived_caches(fonts_api):
+    fonts_api.get_coding_fonts()
+    
+    fonts_api.invalidate('families')
+    
+    assert fonts_api._family_index == {}
+    assert fonts_api._coding_fonts_cache is None
+    with pytest.raises(ValueError):
+        fonts_api.invalidate('nonsense')
+
+def test_invalidate_bypass_disk_deletes_families_file(fonts_api):
+    fonts_api._write_cache_file(fonts_api._families_cache_file,
+                                {'families': _FAMILIES, 'cached_at': time.time()})
+    
+    fonts_api.invalidate('families')
+    assert fonts_api._families_cache_file.exists()
+    
+    fonts_api.invalidate('families', bypass_disk=True)
+    assert not fonts_api._families_cache_file.exists()
+
+def test_cache_file_round_trip_leaves_no_temporary_files(fonts_api):
+    cache_file = fonts_api.cache_dir / 'roundtrip.json.gz'
+    
+    fonts_api._write_cache_file(cache_file, {'families': _FAMILIES})
+    fonts_api._write_cache_file(cache_file, {'families': _FAMILIES[:1]})
+    
+    assert fonts_api._read_cache_file(cache_file) == {'families': _FAMILIES[:1]}
+    assert not list(fonts_api.cache_dir.glob('*.tmp'))
@@ -0,0 +1,117 @@
+"""Tests for SQLEngine result caching and cache invalidation."""
+
+import pytest
+
+from database.sql_engine import SQLEngine
+
+_EXPENSIVE_QUERY = ("SELECT e.department, COUNT(*) AS staff FROM employees e "
+                    "JOIN departments d ON e.department = d.dept_name GROUP BY e.department")
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = SQLEngine(str(tmp_path / 'test.db'))
+    yield engine
+    engine.close()
+
+def _stored_results(engine):
+    return engine.connection.execute("SELECT COUNT(*) FROM query_cache").fetchone()[0]
+
+def test_select_results_are_memoized(engine):
+    first = engine.execute_query("SELECT COUNT(*) AS n FROM departments")
+    
+    assert engine._query_cache.cache_info().currsize == 1
+    assert engine.execute_query("SELECT COUNT(*) AS n FROM departments") == first
+
+def test_execute_update_invalidates_cached_results(engine):
+    before = engine.execute_query("SELECT COUNT(*) AS n FROM departments")[0]['n']
+    engine.execute_query(_EXPENSIVE_QUERY)
+    assert _stored_results(engine) == 1
+    
+    engine.execute_update(
+        "INSERT INTO departments (dept_id, dept_name, location, budget) VALUES (?, ?, ?, ?)",
+        (999, 'Research', 'Remote', 1000))
+    
+    assert engine.execute_query("SELECT COUNT(*) AS n FROM departments")[0]['n'] == before + 1
+    assert _stored_results(engine) == 0
+
+def test_writes_through_execute_query_invalidate_cached_results(engine):
+    before = engine.execute_query("SELECT COUNT(*) AS n FROM departments")[0]['n']
+    engine.execute_query(_EXPENSIVE_QUERY)
+    
+    engine.execute_query(
+        "INSERT INTO departments (dept_id, dept_name, location, budget) "
+        "VALUES (998, 'Labs', 'Remote', 1000)")
+    
+    assert engine.execute_query("SELECT COUNT(*) AS n FROM departments")[0]['n'] == before + 1
+    assert _stored_results(engine) == 0
+
+def test_with_queries_read_without_flushing_caches(engine):
+    engine.execute_query(_EXPENSIVE_QUERY)
+    
+    rows = engine.execute_query("WITH x AS (SELECT 1 AS a) SELECT * FROM x")
+    
+    assert rows == [{'a': 1}]
+    assert _stored_results(engine) == 1
+
+def test_writing_with_clause_is_rejected(engine):
+    before = engine.execute_query("SELECT COUNT(*) AS n FROM departments")[0]['n']
+    engine.execute_query(_EXPENSIVE_QUERY)
+    
+    assert engine.execute_query(
+        "WITH new(id) AS (SELECT 998) "
+        "INSERT INTO departments (dept_id, dept_name, location, budget) "
+        "SELECT id, 'Labs', 'Remote', 1000 FROM new") == []
+    
+    assert engine.execute_query("SELECT COUNT(*) AS n FROM departments")[0]['n'] == before
+    assert _stored_results(engine) == 1
+
+def test_named_parameters_are_bound_by_name(engine):
+    assert engine.execute_query("SELECT :n AS v, :m AS w", {'n': 5, 'm': 6}) == [{'v': 5, 'w': 6}]
+    assert engine.execute_query("SELECT :n AS v, :m AS w", {'m': 8, 'n': 7}) == [{'v': 7, 'w': 8}]
+
+def test_in_memory_reads_cannot_write():
+    engine = SQLEngine(':memory:')
+    try:
+        before = engine.execute_query("SELECT COUNT(*) AS n FROM departments")[0]['n']
+        engine.execute_query(
+            "WITH new(id) AS (SELECT 997) "
+            "INSERT INTO departments (dept_id, dept_name, location, budget) "
+            "SELECT id, 'Labs', 'Remote', 1000 FROM new")
+        
+        assert engine.execute_query("SELECT COUNT(*) AS n FROM departments")[0]['n'] == before
+        assert engine.execute_update(
+            "INSERT INTO departments (dept_id, dept_name, location, budget) "
+            "VALUES (996, 'Labs', 'Remote', 1000)") == 1
+    finally:
+        engine.close()
+
+def test_persisted_results_survive_a_new_engine(engine, tmp_path):
+    expected = engine.execute_query(_EXPENSIVE_QUERY)
+    engine.close()
+    
+    reopened = SQLEngine(str(tmp_path / 'test.db'))
+    try:
+        assert reopened.execute_query(_EXPENSIVE_QUERY) == expected
+        assert _stored_results(reopened) == 1
+    finally:
+        reopened.close()
+
+def test_results_with_blobs_are_not_persisted(engine):
+    engine.execute_update("CREATE TABLE files (id INTEGER PRIMARY KEY, data BLOB)")
+    engine.execute_update("INSERT INTO files (id, data) VALUES (1, ?)", (b'\x00\xff',))
+    query = "SELECT f.data FROM files f JOIN files g ON f.id = g.id"
+    
+    assert engine.execute_query(query) == [{'data': b'\x00\xff'}]
+    assert _stored_results(engine) == 0
+    
+    engine._query_cache.cache_clear()
+    assert engine.execute_query(query) == [{'data': b'\x00\xff'}]
+
+def test_missing_tables_do_not_break_queries(monkeypatch):
+    monkeypatch.setattr(SQLEngine, 'create_tables', lambda self: None)
+    fresh = SQLEngine(':memory:')
+    try:
+        assert fresh.execute_query("SELECT * FROM employees") == []
+        assert fresh.execute_query("SELECT 1 AS one") == [{'one': 1}]
+    finally:
+        fresh.close()
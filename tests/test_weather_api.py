@@ -0,0 +1,132 @@
+"""Tests for the WeatherAPI in-memory and on-disk caches."""
+
+import threading
+import time
+
+import pytest
+
+from apis.weather_api import WeatherAPI
+
+class _Response:
+    """Just enough of an HTTP response for the fetch paths."""
+    
+    def __init__(self, status_code, content=b'', headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+    
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise AssertionError(f"unexpected HTTP {self.status_code}")
+
+class _Client:
+    """Records requests and answers each with the next queued response."""
+    
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+    
+    def get(self, url, headers=None, timeout=None):
+        self.requests.append((url, headers or {}))
+        return self.responses.pop(0)
+
+_CURRENT_PAYLOAD = (b'{"name": "Oslo", "sys": {"country": "NO"}, '
+                    b'"main": {"temp": 3.5, "feels_like": 1.0, "humidity": 80, "pressure": 1000}, '
+                    b'"weather": [{"main": "Snow", "description": "light snow", "icon": "13d"}], '
+                    b'"wind": {"speed": 2.0, "deg": 90}, "visibility": 8000}')
+
+@pytest.fixture
+def weather_api(config):
+    api = WeatherAPI(config)
+    api.api_key = 'test-key'
+    return api
+
+def test_cache_evicts_least_recently_used(weather_api):
+    weather_api.cache_max_entries = 2
+    weather_api._cache_data('a', {'n': 1})
+    weather_api._cache_data('b', {'n': 2})
+    
+    assert weather_api._get_cached('a')['data'] == {'n': 1}  # 'a' is now most recent
+    weather_api._cache_data('c', {'n': 3})
+    
+    assert list(weather_api.cache) == ['a', 'c']
+    assert weather_api._get_cached('b') is None
+
+def test_expired_entry_is_not_served(weather_api):
+    weather_api._cache_data('forecast_Oslo_5', {'forecasts': []})
+    weather_api.cache['forecast_Oslo_5']['expires'] = time.monotonic() - 1
+    
+    assert weather_api._get_cached('forecast_Oslo_5') is None
+
+def test_cached_weather_survives_concurrent_eviction(weather_api, monkeypatch):
+    weather_api._cache_data('current_Oslo', {'temperature': 3.5})
+    original = weather_api._get_cached
+    
+    def lookup_then_evict(cache_key):
+        entry = original(cache_key)
+        weather_api.cache.clear()  # Another thread evicts right after the lookup
+        return entry
+    
+    monkeypatch.setattr(weather_api, '_get_cached', lookup_then_evict)
+    assert weather_api.get_current_weather('Oslo') == {'temperature': 3.5}
+
+def test_stale_entry_is_revalidated_with_etag(weather_api):
+    weather_api.client = _Client(_Response(200, _CURRENT_PAYLOAD, {'ETag': '"v1"'}),
+                                 _Response(304))
+    first = weather_api.get_current_weather('Oslo')
+    assert first.temperature == 3.5
+    
+    weather_api.cache['current_Oslo']['expires'] = time.monotonic() - 1
+    second = weather_api.get_current_weather('Oslo')
+    
+    assert second is first
+    assert weather_api.client.requests[1][1]['If-None-Match'] == '"v1"'
+    assert weather_api._get_cached('current_Oslo') is not None
+
+def test_concurrent_fetches_are_coalesced(weather_api):
+    calls = []
+    release = threading.Event()
+    
+    def slow_fetch():
+        calls.append(1)
+        release.wait(5)
+        return 'result'
+    
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(
+        weather_api._single_flight('key', slow_fetch))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    
+    assert calls == [1]
+    assert results == ['result'] * 4
+
+def test_async_client_rejects_thread_pool_batches(config):
+    from apis.weather_api import AsyncWeatherAPI
+    
+    api = AsyncWeatherAPI(config)
+    
+    with pytest.raises(TypeError):
+        api.get_current_weather_many(['Oslo'])
+    with pytest.raises(TypeError):
+        api.search_locations_many(['Oslo'])
+
+def test_disk_cache_skips_unreadable_rows(weather_api, config):
+    weather_api._cache_data('forecast_Oslo_5', {'forecasts': []})
+    with weather_api._disk_cache:
+        weather_api._disk_cache.execute(
+            "INSERT INTO weather_cache (cache_key, data, cached_at) VALUES (?, ?, ?)",
+            ('current_Bad', '{"unexpected": 1}', time.time()))
+    
+    reopened = WeatherAPI(config)
+    
+    assert reopened._disk_cache is not None
+    assert reopened._get_cached('forecast_Oslo_5')['data'] == {'forecasts': []}
+    assert 'current_Bad' not in reopened.cache
+    remaining = reopened._disk_cache.execute(
+        "SELECT cache_key FROM weather_cache").fetchall()
+    assert remaining == [('forecast_Oslo_5',)]
@@ -53,6 +53,8 @@ class Config:
             'ai_model_preference': 'gpt-3.5-turbo',
             'sql_tutorial_progress': {},
             'recent_projects': [],
+            'debug_pretty_caches': False,  # Indent JSON cache files for debugging
+            'debug': False,  # Echo widget status messages to stdout
             'api_endpoints': {
                 'weather': 'https://api.openweathermap.org/data/2.5',
                 'fonts': 'https://www.googleapis.com/webfonts/v1',